@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import csv
+import functools
 import logging
-import re
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -16,10 +17,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-
-from gui.workers import VariantFetchWorker
-
-from interface_py import moteur_variante
+# Column order used by the Excel and CSV exports
+EXPORT_FIELDS = ("Product", "Variant", "Image")
 
 
 class AlphaEngine(QWidget):
@@ -59,16 +58,42 @@ class AlphaEngine(QWidget):
         self.button_csv = QPushButton("Exporter CSV")
         self.button_csv.clicked.connect(self.export_csv)
         export_layout.addWidget(self.button_csv)
+
+        self.button_parquet = QPushButton("Exporter Parquet")
+        self.button_parquet.clicked.connect(self.export_parquet)
+        export_layout.addWidget(self.button_parquet)
         layout.addLayout(export_layout)
 
     @staticmethod
+    def _strip_size_suffix(filename: str) -> str:
+        """Remove a ``-<digits>`` suffix placed right before the extension."""
+        dot = filename.rfind(".")
+        if dot < 0 or dot == len(filename) - 1:
+            return filename
+        i = dot
+        while i > 0 and filename[i - 1].isdigit():
+            i -= 1
+        if 0 < i < dot and filename[i - 1] == "-":
+            return filename[:i - 1] + filename[dot:]
+        return filename
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _wp_filename(img_url: str) -> str:
+        """Return the file name of *img_url* without its ``-<digits>`` suffix."""
+        end = img_url.find("?")
+        if end < 0:
+            end = len(img_url)
+        name = img_url[img_url.rfind("/", 0, end) + 1:end]
+        return AlphaEngine._strip_size_suffix(name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _build_wp_url(domain: str, date_path: str, img_url: str) -> str:
         """Return WordPress URL for *img_url* using domain and date."""
-        filename = img_url.split("/")[-1].split("?")[0]
-        filename = re.sub(r"-\d+(?=\.\w+$)", "", filename)
         domain = domain.rstrip("/")
         date_path = date_path.strip("/")
-        return f"{domain}/wp-content/uploads/{date_path}/{filename}"
+        return f"{domain}/wp-content/uploads/{date_path}/{AlphaEngine._wp_filename(img_url)}"
 
     # --- Slots -------------------------------------------------------------
     def start_analysis(self) -> None:
@@ -78,29 +103,35 @@ class AlphaEngine(QWidget):
             QMessageBox.warning(self, "Erreur", "Aucune URL fournie")
             return
 
+        # Imported lazily: pulls in Selenium and every scraper module
+        from gui.workers import VariantFetchWorker
+
         self.button_start.setEnabled(False)
         self.result_view.clear()
         self.result_view.append("Analyse en cours...")
 
-        self._worker = VariantFetchWorker(url)
+        # An explicit analysis always reloads the page instead of reusing
+        # variants cached by a recent scraping run.
+        self._worker = VariantFetchWorker(url, use_cache=False)
         self._worker.result.connect(self._display_result)
         self._worker.log.connect(self._handle_log)
         self._worker.finished.connect(self._analysis_finished)
         self._worker.start()
 
     def _display_result(self, title: str, variants: dict) -> None:
-        domain = self.input_domain.text().strip()
-        date_path = self.input_date.text().strip()
-
-        self.result_view.clear()
-        self._export_rows = []
-        self.result_view.append(title)
-        for name, img in variants.items():
-            wp_url = self._build_wp_url(domain, date_path, img)
-            self.result_view.append(f"{name} -> {wp_url}")
-            self._export_rows.append(
-                {"Product": title, "Variant": name, "Image": wp_url}
-            )
+        domain = self.input_domain.text().strip().rstrip("/")
+        date_path = self.input_date.text().strip().strip("/")
+        prefix = f"{domain}/wp-content/uploads/{date_path}/"
+        wp_filename = self._wp_filename
+
+        rows = [(name, prefix + wp_filename(img)) for name, img in variants.items()]
+        self._export_rows = [
+            {"Product": title, "Variant": name, "Image": wp_url}
+            for name, wp_url in rows
+        ]
+        self.result_view.setPlainText(
+            "\n".join([title, *(f"{name} -> {wp_url}" for name, wp_url in rows)])
+        )
 
     def _handle_log(self, msg: str) -> None:
         if msg.startswith("ERROR:"):
@@ -120,11 +151,17 @@ class AlphaEngine(QWidget):
         )
         if not path:
             return
-        import pandas as pd  # Imported lazily to avoid mandatory dependency
+        import xlsxwriter  # Imported lazily to avoid mandatory dependency
 
-        df = pd.DataFrame(self._export_rows)
         try:
-            df.to_excel(path, index=False)
+            workbook = xlsxwriter.Workbook(
+                path, {"constant_memory": True, "strings_to_urls": False}
+            )
+            sheet = workbook.add_worksheet()
+            sheet.write_row(0, 0, EXPORT_FIELDS)
+            for i, row in enumerate(self._export_rows, 1):
+                sheet.write_row(i, 0, [row[key] for key in EXPORT_FIELDS])
+            workbook.close()
         except Exception as exc:  # noqa: BLE001
             QMessageBox.critical(self, "Erreur", str(exc))
         else:
@@ -137,11 +174,42 @@ class AlphaEngine(QWidget):
         )
         if not path:
             return
-        import pandas as pd  # Imported lazily to avoid mandatory dependency
+        try:
+            with open(
+                path, "w", newline="", encoding="utf-8", buffering=1024 * 1024
+            ) as fh:
+                writer = csv.DictWriter(fh, fieldnames=EXPORT_FIELDS)
+                writer.writeheader()
+                writer.writerows(self._export_rows)
+        except Exception as exc:  # noqa: BLE001
+            QMessageBox.critical(self, "Erreur", str(exc))
+        else:
+            QMessageBox.information(self, "Exporté", "Fichier enregistré")
+
+    def export_parquet(self) -> None:
+        """Export the current results to a Parquet or Feather file."""
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Enregistrer sous",
+            "resultats.parquet",
+            "Parquet (*.parquet);;Feather (*.feather)",
+        )
+        if not path:
+            return
+        # pyarrow writes both formats directly, without paying for a pandas
+        # import on the GUI thread. Imported lazily to avoid mandatory dependency.
+        import pyarrow as pa
+        from pyarrow import feather, parquet
 
-        df = pd.DataFrame(self._export_rows)
         try:
-            df.to_csv(path, index=False)
+            table = pa.Table.from_pylist(
+                [{key: row[key] for key in EXPORT_FIELDS} for row in self._export_rows],
+                schema=pa.schema([(key, pa.string()) for key in EXPORT_FIELDS]),
+            )
+            if path.lower().endswith(".feather"):
+                feather.write_feather(table, path)
+            else:
+                parquet.write_table(table, path, compression="zstd")
         except Exception as exc:  # noqa: BLE001
             QMessageBox.critical(self, "Erreur", str(exc))
         else:
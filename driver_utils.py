@@ -1,7 +1,18 @@
-from interface_py import driver_utils as _mod
+from interface_py.driver_utils import *  # noqa: F401,F403
+from interface_py.driver_utils import (  # noqa: F401
+    setup_driver,
+    acquire_driver,
+    release_driver,
+    close_driver,
+    _load_headless_from_settings,
+    _load_driver_path_from_settings,
+)
 
-def __getattr__(name):
-    return getattr(_mod, name)
-
-def __setattr__(name, value):
-    setattr(_mod, name, value)
+__all__ = [
+    "setup_driver",
+    "acquire_driver",
+    "release_driver",
+    "close_driver",
+    "_load_headless_from_settings",
+    "_load_driver_path_from_settings",
+]
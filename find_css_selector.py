@@ -1,13 +1,12 @@
-from interface_py import find_css_selector as _mod
+from interface_py.find_css_selector import *  # noqa: F401,F403
+from interface_py.find_css_selector import (  # noqa: F401
+    find_best_css_selector,
+    run_gui,
+    main,
+)
 
-
-def __getattr__(name):
-    return getattr(_mod, name)
-
-
-def __setattr__(name, value):
-    setattr(_mod, name, value)
+__all__ = ["find_best_css_selector", "run_gui", "main"]
 
 
 if __name__ == "__main__":
-    _mod.main()
+    main()
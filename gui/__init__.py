@@ -19,6 +19,7 @@ from .workers import (
     ScrapPriceWorker,
     ScrapVariantWorker,
     VariantFetchWorker,
+    DeleteFoldersWorker,
 )
 
 __all__ = [
@@ -36,4 +37,5 @@ __all__ = [
     'ScrapPriceWorker',
     'ScrapVariantWorker',
     'VariantFetchWorker',
+    'DeleteFoldersWorker',
 ]
@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import sys
 import os
-import shutil
 import subprocess
 import time
-import re
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -39,7 +38,7 @@ from PySide6.QtGui import QFont, QPixmap, QIcon, QClipboard
 
 from settings_manager import SettingsManager, apply_settings
 from site_profile_manager import SiteProfileManager
-from alpha_engine import AlphaEngine
+from alpha_engine import EXPORT_FIELDS, AlphaEngine
 
 from .utils import (
     ICON_SIZE,
@@ -57,6 +56,7 @@ from interface_py.constants import (
     VARIANT_DEFAULT_SELECTOR as MV_DEFAULT_SELECTOR,
     IMAGES_DEFAULT_SELECTOR as DEFAULT_CSS_SELECTOR,
     USER_AGENT,
+    MAX_DOWNLOAD_THREADS,
 )
 from .workers import (
     ScrapLienWorker,
@@ -65,6 +65,7 @@ from .workers import (
     ScrapPriceWorker,
     ScrapVariantWorker,
     VariantFetchWorker,
+    DeleteFoldersWorker,
 )
 
 from interface_py.ui import (
@@ -79,14 +80,16 @@ from interface_py.ui import (
 )
 
 
-
 class Alpha2Widget(QWidget):
     """Scrape images then variants using a single URL."""
 
     def __init__(self, manager: SettingsManager) -> None:
         super().__init__()
         self.manager = manager
-        self._export_rows: list[dict[str, str]] = []
+        # Export data is kept column-wise, one list per EXPORT_FIELDS entry.
+        self._products: list[str] = []
+        self._variants: list[str] = []
+        self._images: list[str] = []
 
         main_layout = QVBoxLayout(self)
 
@@ -109,7 +112,7 @@ class Alpha2Widget(QWidget):
         inputs_layout.addLayout(dir_layout)
 
         self.spin_threads = QSpinBox()
-        self.spin_threads.setRange(1, 32)
+        self.spin_threads.setRange(1, MAX_DOWNLOAD_THREADS)
         self.spin_threads.setValue(manager.settings.get("alpha2_threads", 3))
         inputs_layout.addWidget(QLabel("Threads parallèles"))
         inputs_layout.addWidget(self.spin_threads)
@@ -138,9 +141,18 @@ class Alpha2Widget(QWidget):
         self.button_toggle_console.clicked.connect(self.toggle_console)
         state_layout.addWidget(self.button_toggle_console)
         self.log_view = QPlainTextEdit(readOnly=True)
+        self.log_view.setMaximumBlockCount(5000)
         state_layout.addWidget(self.log_view)
         state_layout.addStretch()
 
+        # Worker logs are buffered and flushed at ~20 Hz so bursts of
+        # records cost one document update instead of one per line.
+        self._log_buf: deque[str] = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
         # --- Export -----------------------------------------------------
         group_export = QGroupBox("Export")
         export_layout = QVBoxLayout(group_export)
@@ -157,6 +169,10 @@ class Alpha2Widget(QWidget):
 
         self.images_worker: ScraperImagesWorker | None = None
         self.variant_worker: VariantFetchWorker | None = None
+        self.delete_worker: DeleteFoldersWorker | None = None
+        self._last_prog_ts = 0.0
+        self._delete_error = ""
+        self._pending = 0
 
         for w in [self.input_url, self.input_dir]:
             w.editingFinished.connect(self.save_fields)
@@ -183,6 +199,7 @@ class Alpha2Widget(QWidget):
 
         self.button_start.setEnabled(False)
         self.progress.setValue(0)
+        self._log_buf.clear()
         self.log_view.clear()
 
         self.save_fields()
@@ -196,36 +213,60 @@ class Alpha2Widget(QWidget):
             None,
             self.spin_threads.value(),
         )
-        self.images_worker.log.connect(self.log_view.appendPlainText)
+        self.images_worker.log.connect(self._log_buf.append)
         self.images_worker.progress.connect(self.update_progress)
-        self.images_worker.finished.connect(self.start_variant_phase)
+        self.images_worker.finished.connect(self._on_phase_done)
+
+        # Variant extraction does not need the images on disk, so both
+        # phases run side by side on the same product URL.
+        self.variant_worker = VariantFetchWorker(url)
+        self.variant_worker.log.connect(self._log_buf.append)
+        self.variant_worker.result.connect(self.process_variants)
+        self.variant_worker.finished.connect(self._on_phase_done)
 
         self.images_done = 0
         self.total_images = 0
         self.start_time = time.perf_counter()
+        self._last_prog_ts = 0.0
+        self._pending = 2
         self.images_worker.start()
-
-    def start_variant_phase(self) -> None:
-        url = self.input_url.text().strip()
-        self.variant_worker = VariantFetchWorker(url)
-        self.variant_worker.log.connect(self.log_view.appendPlainText)
-        self.variant_worker.result.connect(self.process_variants)
-        self.variant_worker.finished.connect(self.on_variant_finished)
         self.variant_worker.start()
 
+    def _on_phase_done(self) -> None:
+        self._pending -= 1
+        if self._pending == 0:
+            self.on_variant_finished()
+
     def process_variants(self, title: str, mapping: dict) -> None:
         domain = self.manager.settings.get("linkgen_base_url", "https://example.com")
         date_path = self.manager.settings.get("linkgen_date", "2025/07")
-        self._export_rows = []
-        self.log_view.appendPlainText(title)
-        for name, img in mapping.items():
-            wp_url = self._build_wp_url(domain, date_path, img)
-            self.log_view.appendPlainText(f"{name} -> {wp_url}")
-            self._export_rows.append({"Product": title, "Variant": name, "Image": wp_url})
+        prefix = f"{domain.rstrip('/')}/wp-content/uploads/{date_path.strip('/')}/"
+        wp_filename = self._wp_filename
+        self._variants = list(mapping)
+        self._images = [prefix + wp_filename(img) for img in mapping.values()]
+        self._products = [title] * len(self._variants)
+        lines = [title]
+        lines.extend(
+            f"{name} -> {wp_url}" for name, wp_url in zip(self._variants, self._images)
+        )
+        self._log_buf.append("\n".join(lines))
+
+    def _flush_log(self) -> None:
+        if not self._log_buf:
+            return
+        chunk = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        self.log_view.appendPlainText(chunk)
 
     def update_progress(self, done: int, total: int) -> None:
         self.images_done = done
         self.total_images = total
+        # Repaint at most ~30 times per second; the first and last ticks
+        # always go through so the bar starts and ends on exact values.
+        now = time.perf_counter()
+        if 0 < done < total and now - self._last_prog_ts < 0.033:
+            return
+        self._last_prog_ts = now
         value = int(done / total * 100) if total else 0
         self.progress.setValue(value)
         if done == 0 or total == 0:
@@ -249,6 +290,7 @@ class Alpha2Widget(QWidget):
         )
 
     def on_variant_finished(self) -> None:
+        self._flush_log()
         self.button_start.setEnabled(True)
         self.label_timer.setText("Temps restant : 0 seconde(s)")
         QMessageBox.information(self, "Terminé", "Le scraping complet est terminé.")
@@ -267,16 +309,27 @@ class Alpha2Widget(QWidget):
         )
         if reply != QMessageBox.Yes:
             return
-        try:
-            for child in dest.iterdir():
-                if child.is_dir():
-                    shutil.rmtree(child)
+        self._delete_error = ""
+        self.button_delete.setEnabled(False)
+        self.delete_worker = DeleteFoldersWorker(dest)
+        self.delete_worker.failed.connect(self._on_delete_failed)
+        self.delete_worker.finished.connect(self._on_folders_deleted)
+        self.delete_worker.start()
+
+    def _on_delete_failed(self, message: str) -> None:
+        self._delete_error = message
+
+    def _on_folders_deleted(self) -> None:
+        self.button_delete.setEnabled(True)
+        if self._delete_error:
+            QMessageBox.critical(
+                self, "Erreur", f"Erreur lors de la suppression : {self._delete_error}"
+            )
+        else:
             QMessageBox.information(self, "Supprimé", "Les dossiers ont été supprimés.")
-        except Exception as exc:  # noqa: BLE001
-            QMessageBox.critical(self, "Erreur", f"Erreur lors de la suppression : {exc}")
 
     def export_excel(self) -> None:
-        if not self._export_rows:
+        if not self._variants:
             QMessageBox.warning(self, "Erreur", "Aucune donnée à exporter.")
             return
         path, _ = QFileDialog.getSaveFileName(
@@ -284,11 +337,18 @@ class Alpha2Widget(QWidget):
         )
         if not path:
             return
-        import pandas as pd
+        import xlsxwriter  # Imported lazily to avoid mandatory dependency
 
-        df = pd.DataFrame(self._export_rows)
         try:
-            df.to_excel(path, index=False)
+            workbook = xlsxwriter.Workbook(
+                path, {"constant_memory": True, "strings_to_urls": False}
+            )
+            sheet = workbook.add_worksheet()
+            sheet.write_row(0, 0, EXPORT_FIELDS)
+            rows = zip(self._products, self._variants, self._images)
+            for i, row in enumerate(rows, 1):
+                sheet.write_row(i, 0, row)
+            workbook.close()
         except Exception as exc:  # noqa: BLE001
             QMessageBox.critical(self, "Erreur", str(exc))
         else:
@@ -299,10 +359,14 @@ class Alpha2Widget(QWidget):
         self.manager.save_setting("alpha2_parent", self.input_dir.text())
         self.manager.save_setting("alpha2_threads", self.spin_threads.value())
 
+    @staticmethod
+    def _wp_filename(img_url: str) -> str:
+        # Shares AlphaEngine's cached tail scan instead of a regex per image.
+        return AlphaEngine._wp_filename(img_url)
+
     @staticmethod
     def _build_wp_url(domain: str, date_path: str, img_url: str) -> str:
-        filename = img_url.split("/")[-1].split("?")[0]
-        filename = re.sub(r"-\d+(?=\.\w+$)", "", filename)
+        filename = Alpha2Widget._wp_filename(img_url)
         domain = domain.rstrip("/")
         date_path = date_path.strip("/")
         return f"{domain}/wp-content/uploads/{date_path}/{filename}"
@@ -391,17 +455,20 @@ class MainWindow(QMainWindow):
             "settings.svg",
         ]
         self.icon_paths = [ICONS_DIR / name for name in icon_names]
+        # Decode each SVG once; the sidebar and title bar reuse these icons.
+        self.icons = [QIcon(str(path)) for path in self.icon_paths]
+        self._icon_size = QSize(ICON_SIZE, ICON_SIZE)
 
         self.sidebar = QWidget()
         side_layout = QVBoxLayout(self.sidebar)
         side_layout.setContentsMargins(0, 0, 0, 0)
 
         self.side_buttons: list[QToolButton] = []
-        for i, (text, icon) in enumerate(zip(labels[:-1], self.icon_paths[:-1])):
+        for i, (text, icon) in enumerate(zip(labels[:-1], self.icons[:-1])):
             section = CollapsibleSection(
                 ToggleSwitch,
                 text,
-                QIcon(str(icon)),
+                icon,
                 lambda checked=False, i=i: self.show_page(i),
             )
             side_layout.addWidget(section)
@@ -416,14 +483,14 @@ class MainWindow(QMainWindow):
         section = CollapsibleSection(
             ToggleSwitch,
             labels[-1],
-            QIcon(str(self.icon_paths[-1])),
+            self.icons[-1],
             lambda checked=False, i=bottom_index: self.show_page(i),
         )
         side_layout.addWidget(section)
         self.side_buttons.append(section.header)
 
         for btn in self.side_buttons:
-            btn.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
+            btn.setIconSize(self._icon_size)
 
         # Top bar
         self.toolbar = QToolBar()
@@ -437,51 +504,31 @@ class MainWindow(QMainWindow):
 
         self.label_title = QToolButton()
         self.label_title.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
-        self.label_title.setIcon(QIcon(str(self.icon_paths[0])))
+        self.label_title.setIcon(self.icons[0])
         self.label_title.setIconSize(QSize(24, 24))
         self.label_title.setText(labels[0])
         self.label_title.setEnabled(False)
         self.toolbar.addWidget(self.label_title)
 
+        # Pages are built on first display; placeholders keep the stack
+        # indexes aligned with the sidebar until then.
         self.stack = QStackedWidget()
-        self.page_profiles = PageProfiles(self.profile_manager, self)
-        self.page_scrap = PageScrapLienCollection(settings)
-        self.page_images = PageScraperImages(settings)
-        self.page_desc = PageScrapDescription(settings)
-        self.page_price = PageScrapPrice(settings)
-        self.page_linkgen = PageLinkGenerator(settings)
-        self.page_variants = PageVariantScraper(settings)
-        self.page_alpha = AlphaEngine()
-        self.page_alpha2 = Alpha2Widget(settings)
-        self.page_settings = PageSettings(settings, self.apply_settings)
-        self.page_maintenance = MaintenancePage()
-        self.stack.addWidget(self.page_profiles)
-        self.stack.addWidget(self.page_scrap)
-        self.stack.addWidget(self.page_images)
-        self.stack.addWidget(self.page_desc)
-        self.stack.addWidget(self.page_price)
-        self.stack.addWidget(self.page_linkgen)
-        self.stack.addWidget(self.page_variants)
-        self.stack.addWidget(self.page_alpha)
-        self.stack.addWidget(self.page_alpha2)
-        self.stack.addWidget(self.page_settings)
-        self.stack.addWidget(self.page_maintenance)
-
-        self.page_images.input_source.editingFinished.connect(
-            lambda: self.profile_manager.detect_and_apply(
-                self.page_images.input_source.text(), self
-            )
-        )
-        self.page_scrap.input_url.editingFinished.connect(
-            lambda: self.profile_manager.detect_and_apply(
-                self.page_scrap.input_url.text(), self
-            )
-        )
-        self.page_price.input_url.editingFinished.connect(
-            lambda: self.profile_manager.detect_and_apply(
-                self.page_price.input_url.text(), self
-            )
-        )
+        self._page_factories: list[Callable[[], QWidget]] = [
+            lambda: PageProfiles(self.profile_manager, self),
+            lambda: PageScrapLienCollection(settings),
+            lambda: PageScraperImages(settings),
+            lambda: PageScrapDescription(settings),
+            lambda: PageScrapPrice(settings),
+            lambda: PageLinkGenerator(settings),
+            lambda: PageVariantScraper(settings),
+            AlphaEngine,
+            lambda: Alpha2Widget(settings),
+            lambda: PageSettings(settings, self.apply_settings),
+            MaintenancePage,
+        ]
+        self._pages: list[QWidget | None] = [None] * len(self._page_factories)
+        for _ in self._page_factories:
+            self.stack.addWidget(QWidget())
 
         self.stack.currentChanged.connect(self.update_title)
 
@@ -506,14 +553,52 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(container)
 
         self.sidebar_visible = True
+        self._sidebar_anim = QPropertyAnimation(self.sidebar, b"maximumWidth", self)
+        self._sidebar_anim.setDuration(200)
+        self._sidebar_anim.setEasingCurve(QEasingCurve.InOutCubic)
+        self._sidebar_anim.finished.connect(self._on_sidebar_toggled)
 
         # Set initial page
         self.show_page(0)
 
         self.apply_settings()
 
+    # Input field of each page that triggers site profile detection.
+    _PROFILE_DETECT_FIELDS = {1: "input_url", 2: "input_source", 4: "input_url"}
+
+    page_profiles = property(lambda self: self._page(0))
+    page_scrap = property(lambda self: self._page(1))
+    page_images = property(lambda self: self._page(2))
+    page_desc = property(lambda self: self._page(3))
+    page_price = property(lambda self: self._page(4))
+    page_linkgen = property(lambda self: self._page(5))
+    page_variants = property(lambda self: self._page(6))
+    page_alpha = property(lambda self: self._page(7))
+    page_alpha2 = property(lambda self: self._page(8))
+    page_settings = property(lambda self: self._page(9))
+    page_maintenance = property(lambda self: self._page(10))
+
+    def _page(self, index: int) -> QWidget:
+        """Return page *index*, building it in place of its placeholder."""
+        page = self._pages[index]
+        if page is None:
+            page = self._pages[index] = self._page_factories[index]()
+            placeholder = self.stack.widget(index)
+            self.stack.insertWidget(index, page)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            field_name = self._PROFILE_DETECT_FIELDS.get(index)
+            if field_name:
+                field = getattr(page, field_name)
+                field.editingFinished.connect(
+                    lambda: self.profile_manager.detect_and_apply(field.text(), self)
+                )
+        return page
+
     def show_page(self, index: int) -> None:
         """Display page at given index."""
+        if 0 <= index < len(self._pages):
+            self._page(index)
         self.stack.setCurrentIndex(index)
         if 0 <= index < len(self.side_buttons):
             for i, btn in enumerate(self.side_buttons):
@@ -524,7 +609,7 @@ class MainWindow(QMainWindow):
         """Update title label when page changes."""
         if 0 <= index < len(self.side_buttons):
             self.label_title.setText(self.side_buttons[index].text())
-            self.label_title.setIcon(QIcon(str(self.icon_paths[index])))
+            self.label_title.setIcon(self.icons[index])
 
     def toggle_sidebar(self) -> None:
         start = self.sidebar.width()
@@ -535,13 +620,10 @@ class MainWindow(QMainWindow):
         if not self.sidebar_visible:
             self.sidebar.setVisible(True)
 
-        self._anim = QPropertyAnimation(self.sidebar, b"maximumWidth", self)
-        self._anim.setDuration(200)
-        self._anim.setStartValue(start)
-        self._anim.setEndValue(end)
-        self._anim.setEasingCurve(QEasingCurve.InOutCubic)
-        self._anim.finished.connect(self._on_sidebar_toggled)
-        self._anim.start()
+        self._sidebar_anim.stop()
+        self._sidebar_anim.setStartValue(start)
+        self._sidebar_anim.setEndValue(end)
+        self._sidebar_anim.start()
 
     def _on_sidebar_toggled(self) -> None:
         self.sidebar_visible = not self.sidebar_visible
@@ -1,23 +1,41 @@
 from __future__ import annotations
 
-import io
-import logging
+import os
+import shutil
 import threading
+import time
 from pathlib import Path
 from typing import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from PySide6.QtCore import Signal
 
 from .utils import QtLogHandler
 from interface_py.ui.base_worker import BaseWorker
 from interface_py.scrap_collection import scrape_collection
-from interface_py.constants import DEFAULT_NEXT_SELECTOR as SLC_DEFAULT_NEXT_SELECTOR
+from interface_py.constants import (
+    DEFAULT_NEXT_SELECTOR as SLC_DEFAULT_NEXT_SELECTOR,
+    MAX_DOWNLOAD_THREADS,
+)
 from interface_py import scraper_images
 from interface_py.scrap_description import scrape_description
 from interface_py.scrap_price import scrape_price
 from interface_py import moteur_variante
 
+# Shared by every ScraperImagesWorker so repeated runs reuse the same
+# download threads instead of spawning a fresh pool per product. Threads are
+# started on demand, so sizing it to the spin box maximum costs nothing until
+# a run actually asks for that many.
+_DOWNLOAD_POOL = ThreadPoolExecutor(
+    max_workers=max(int(os.getenv("SCRAP_POOL", "16")), MAX_DOWNLOAD_THREADS),
+    thread_name_prefix="scrap",
+)
+# Per-URL jobs (one Chrome each) run here, separately from the downloads
+# they wait on so a full pool can never deadlock on its own tasks.
+_MAX_JOBS = max(1, int(os.getenv("SCRAP_JOBS", "4")))
+_JOB_POOL = ThreadPoolExecutor(max_workers=_MAX_JOBS, thread_name_prefix="scrap-job")
+
+
 class ScrapLienWorker(BaseWorker):
 
     def __init__(
@@ -34,17 +52,6 @@ class ScrapLienWorker(BaseWorker):
         self.selector = selector
         self.output_format = output_format
 
-    def _setup_logger(self) -> tuple[logging.Logger, logging.Handler]:
-        logger, handler = super()._setup_logger()
-        self._stream_handler = logging.StreamHandler(io.StringIO())
-        self._stream_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-        logger.addHandler(self._stream_handler)
-        return logger, handler
-
-    def _cleanup_logger(self, logger: logging.Logger, handler: logging.Handler) -> None:
-        logger.removeHandler(self._stream_handler)
-        super()._cleanup_logger(logger, handler)
-
     def work(self) -> None:
         scrape_collection(
             self.url,
@@ -52,11 +59,15 @@ class ScrapLienWorker(BaseWorker):
             self.selector,
             SLC_DEFAULT_NEXT_SELECTOR,
             self.output_format,
+            logger=self.logger,
         )
 
 
 class ScraperImagesWorker(BaseWorker):
-    """Background worker to download images using scraper_images."""
+    """Background worker to download images using scraper_images.
+
+    ``max_jobs`` is clamped to the shared job pool size (``SCRAP_JOBS``).
+    """
 
     progress = Signal(int, int)
     preview_path = Signal(str)
@@ -73,21 +84,40 @@ class ScraperImagesWorker(BaseWorker):
         max_jobs: int = 1,
     ):
         super().__init__()
-        self.urls = urls
+        # Same product listed twice (e.g. from two collections) is fetched once.
+        self.urls = list(dict.fromkeys(urls))
         self.parent_dir = parent_dir
         self.selector = selector
         self.open_folder = open_folder
         self.show_preview = show_preview
         self.alt_json = alt_json
         self.max_threads = max_threads
-        self.max_jobs = max_jobs
+        self.max_jobs = max(1, min(max_jobs, _MAX_JOBS))
 
     def work(self) -> None:
-        logger = logging.getLogger()
+        logger = self.logger
         images_done = 0
         total_images = 0
+        emitted = (0, 0)
+        last_emit = 0.0
         lock = threading.Lock()
 
+        def emit_progress(force: bool = False) -> None:
+            # Called with ``lock`` held. Large batches are coalesced to about
+            # 200 steps or one update per 50 ms instead of one per image.
+            nonlocal emitted, last_emit
+            now = time.monotonic()
+            step = max(1, total_images // 200)
+            if (
+                force
+                or images_done >= total_images
+                or images_done - emitted[0] >= step
+                or now - last_emit >= 0.05
+            ):
+                emitted = (images_done, total_images)
+                last_emit = now
+                self.progress.emit(images_done, total_images)
+
         def make_cb() -> Callable[[int, int], None]:
             first = True
 
@@ -98,44 +128,67 @@ class ScraperImagesWorker(BaseWorker):
                         total_images += t
                         first = False
                     images_done += 1
-                    self.progress.emit(images_done, total_images)
+                    emit_progress()
 
             return cb
 
         self.progress.emit(0, 0)
 
         preview_sent = False
-        with ThreadPoolExecutor(max_workers=self.max_jobs) as executor:
-            future_to_url = {
-                executor.submit(
-                    scraper_images.download_images,
-                    url,
-                    css_selector=self.selector,
-                    parent_dir=self.parent_dir,
-                    progress_callback=make_cb(),
-                    alt_json_path=self.alt_json,
-                    max_threads=self.max_threads,
-                ): url
-                for url in self.urls
-            }
-
-            for fut in as_completed(future_to_url):
-                url = future_to_url[fut]
+
+        def on_first_image(path: Path) -> None:
+            # Show the first image saved by any job, without waiting for
+            # the rest of that product to finish downloading.
+            nonlocal preview_sent
+            with lock:
+                if preview_sent:
+                    return
+                preview_sent = True
+            self.preview_path.emit(str(path))
+        urls = iter(self.urls)
+        future_to_url: dict = {}
+        opened_folders: set[Path] = set()
+
+        def submit_next() -> None:
+            url = next(urls, None)
+            if url is None:
+                return
+            fut = _JOB_POOL.submit(
+                scraper_images.download_images,
+                url,
+                css_selector=self.selector,
+                parent_dir=self.parent_dir,
+                progress_callback=make_cb(),
+                alt_json_path=self.alt_json,
+                max_threads=self.max_threads,
+                executor=_DOWNLOAD_POOL,
+                logger=logger,
+                first_image_callback=on_first_image if self.show_preview else None,
+            )
+            future_to_url[fut] = url
+
+        # Keep at most ``max_jobs`` URLs in flight on the shared job pool.
+        for _ in range(self.max_jobs):
+            submit_next()
+
+        while future_to_url:
+            done, _ = wait(future_to_url, return_when=FIRST_COMPLETED)
+            for fut in done:
+                future_to_url.pop(fut)
+                submit_next()
                 try:
                     info = fut.result()
                     folder = info["folder"]
-                    if (
-                        self.show_preview
-                        and not preview_sent
-                        and info.get("first_image")
-                    ):
-                        self.preview_path.emit(str(info["first_image"]))
-                        preview_sent = True
-                    if self.open_folder:
-                        scraper_images._open_folder(folder)
+                    if self.open_folder and folder not in opened_folders:
+                        opened_folders.add(folder)
+                        scraper_images._open_folder(folder, logger=logger)
                 except Exception as exc:  # noqa: BLE001
                     logger.error("%s", exc)
 
+        with lock:
+            if emitted != (images_done, total_images):
+                emit_progress(force=True)
+
 
 class ScrapDescriptionWorker(BaseWorker):
     """Background worker to extract and save product descriptions."""
@@ -147,7 +200,7 @@ class ScrapDescriptionWorker(BaseWorker):
         self.output = output
 
     def work(self) -> None:
-        scrape_description(self.url, self.selector, self.output)
+        scrape_description(self.url, self.selector, self.output, logger=self.logger)
 
 
 class ScrapPriceWorker(BaseWorker):
@@ -160,7 +213,7 @@ class ScrapPriceWorker(BaseWorker):
         self.output = output
 
     def work(self) -> None:
-        scrape_price(self.url, self.selector, self.output)
+        scrape_price(self.url, self.selector, self.output, logger=self.logger)
 
 
 class ScrapVariantWorker(BaseWorker):
@@ -173,8 +226,12 @@ class ScrapVariantWorker(BaseWorker):
         self.output = output
 
     def work(self) -> None:
-        title, mapping = moteur_variante.extract_variants_with_images(self.url)
-        moteur_variante.save_images_to_file(title, mapping, self.output)
+        title, mapping = moteur_variante.extract_variants_with_images(
+            self.url, logger=self.logger
+        )
+        moteur_variante.save_images_to_file(
+            title, mapping, self.output, logger=self.logger
+        )
 
 
 class VariantFetchWorker(BaseWorker):
@@ -182,11 +239,34 @@ class VariantFetchWorker(BaseWorker):
 
     result = Signal(str, dict)
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, use_cache: bool = True) -> None:
         super().__init__()
         self.url = url
+        self.use_cache = use_cache
 
     def work(self) -> None:
-        title, mapping = moteur_variante.extract_variants_with_images(self.url)
+        title, mapping = moteur_variante.extract_variants_with_images(
+            self.url, use_cache=self.use_cache, logger=self.logger
+        )
         self.result.emit(title, mapping)
 
+
+class DeleteFoldersWorker(BaseWorker):
+    """Remove every sub-directory of *dest* off the GUI thread."""
+
+    failed = Signal(str)
+
+    def __init__(self, dest: Path) -> None:
+        super().__init__()
+        self.dest = dest
+
+    def work(self) -> None:
+        try:
+            # DirEntry caches the type from the directory listing, so no
+            # extra stat() is needed per child.
+            with os.scandir(self.dest) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+        except Exception as exc:  # noqa: BLE001
+            self.failed.emit(str(exc))
@@ -117,7 +117,7 @@ def _run_description(args: argparse.Namespace) -> None:
         args.url = input("\U0001F517 Entrez l'URL du produit : ").strip()
 
     logging.basicConfig(level=getattr(logging, args.log_level), format="%(levelname)s: %(message)s")
-    scrape_description(args.url, args.selector, Path(args.output))
+    scrape_description(args.url, args.selector, Path(args.output), static=args.static)
 
 
 def _run_price(args: argparse.Namespace) -> None:
@@ -125,7 +125,7 @@ def _run_price(args: argparse.Namespace) -> None:
         args.url = input("\U0001F517 Entrez l'URL du produit : ").strip()
 
     logging.basicConfig(level=getattr(logging, args.log_level), format="%(levelname)s: %(message)s")
-    scrape_price(args.url, args.selector, Path(args.output))
+    scrape_price(args.url, args.selector, Path(args.output), static=args.static)
 
 
 def _run_variants(args: argparse.Namespace) -> None:
@@ -180,6 +180,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_desc.add_argument("-s", "--selector", default=DESCRIPTION_DEFAULT_SELECTOR, help="Selecteur CSS de la description (defaut: %(default)s)")
     p_desc.add_argument("-o", "--output", default="description.html", help="Fichier de sortie (defaut: %(default)s)")
     p_desc.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Niveau de logging (defaut: %(default)s)")
+    p_desc.add_argument("--static", action="store_true", help="Lire d'abord le HTML brut, sans navigateur si possible")
     p_desc.set_defaults(func=_run_description)
 
     # Price ---------------------------------------------------------------
@@ -188,6 +189,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_price.add_argument("-s", "--selector", default=PRICE_DEFAULT_SELECTOR, help="Selecteur CSS du prix (defaut: %(default)s)")
     p_price.add_argument("-o", "--output", default="price.txt", help="Fichier de sortie (defaut: %(default)s)")
     p_price.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Niveau de logging (defaut: %(default)s)")
+    p_price.add_argument("--static", action="store_true", help="Lire d'abord le HTML brut, sans navigateur si possible")
     p_price.set_defaults(func=_run_price)
 
     # Variants ------------------------------------------------------------
@@ -12,6 +12,10 @@ VARIANT_DEFAULT_SELECTOR = ".variant-picker__option-values span.sr-only"
 # User agent string for HTTP requests
 USER_AGENT = "ScrapImageBot/1.0"
 
+# Upper bound of the "threads" spin boxes; the shared download pool is at
+# least this large so the chosen value is always honoured.
+MAX_DOWNLOAD_THREADS = 32
+
 # Sidebar layout constants
 ICONS_DIR = Path(__file__).resolve().parents[1] / "icons"
 SIDEBAR_EXPANDED_WIDTH = 180
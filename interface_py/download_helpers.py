@@ -5,6 +5,9 @@ import binascii
 import logging
 import os
 import re
+import shutil
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 import requests
@@ -13,19 +16,139 @@ from interface_py.constants import USER_AGENT
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_SIZE = 1 << 18
+
+# WordPress size suffix such as ``-1024`` in ``image-1024.jpg``
+_SIZE_SUFFIX_RE = re.compile(r"-\d+(?=\.\w+$)")
+
+# Files already saved by this process, keyed by source URL, so images shared
+# between products or repeated in a gallery are copied rather than fetched.
+_DOWNLOADED: OrderedDict[str, Path] = OrderedDict()
+_DOWNLOADED_LOCK = threading.Lock()
+_DOWNLOADED_SIZE = 4096
+
+# HTTP session shared by every download so connections are kept alive.
+# Pooled sockets must not be shared with a forked child, hence the pid.
+_SESSION: requests.Session | None = None
+_SESSION_PID: int | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def is_http_url(url: str) -> bool:
+    """Return ``True`` if *url* uses the ``http`` or ``https`` scheme."""
+    return url[:8].lower().startswith(("http://", "https://"))
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide :class:`requests.Session`, creating it once."""
+    global _SESSION, _SESSION_PID
+    pid = os.getpid()
+    if _SESSION is None or _SESSION_PID != pid:
+        with _SESSION_LOCK:
+            if _SESSION is None or _SESSION_PID != pid:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                # Sized for the shared download pool so concurrent threads
+                # reuse kept-alive connections instead of discarding them.
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=(500, 502, 503, 504),
+                    ),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"User-Agent": USER_AGENT})
+                _SESSION = session
+                _SESSION_PID = pid
+    return _SESSION
+
+
+def remember_download(url: str, path: Path) -> None:
+    """Record that the content of *url* is now stored at *path*."""
+    with _DOWNLOADED_LOCK:
+        _DOWNLOADED[url] = path
+        _DOWNLOADED.move_to_end(url)
+        while len(_DOWNLOADED) > _DOWNLOADED_SIZE:
+            _DOWNLOADED.popitem(last=False)
+
 
 def download_binary(url: str, path: Path, user_agent: str = USER_AGENT) -> None:
-    """Download binary content from *url* into *path* using *user_agent*."""
+    """Download binary content from *url* into *path* using *user_agent*.
+
+    Content already saved from the same URL is copied from that file instead
+    of being downloaded again.
+    """
+    with _DOWNLOADED_LOCK:
+        source = _DOWNLOADED.get(url)
+    if source is not None and source != path:
+        try:
+            shutil.copyfile(source, path)
+        except OSError:
+            pass  # moved or deleted since, download it again
+        else:
+            return
+
     headers = {"User-Agent": user_agent}
+    opened = False
     try:
-        with requests.get(url, headers=headers, stream=True, timeout=10) as resp:
+        with get_session().get(url, headers=headers, stream=True, timeout=10) as resp:
             resp.raise_for_status()
+            # Read the urllib3 stream directly in 256 KB blocks rather than
+            # looping over small iter_content chunks.
+            resp.raw.decode_content = True
             with path.open("wb") as fh:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if chunk:
-                        fh.write(chunk)
-    except requests.exceptions.RequestException as exc:  # pragma: no cover
+                opened = True
+                shutil.copyfileobj(resp.raw, fh, _CHUNK_SIZE)
+    except Exception as exc:  # noqa: BLE001
+        # Reading resp.raw raises urllib3 errors, which are not
+        # RequestException; never leave a truncated image behind.
+        if opened:
+            try:
+                path.unlink()
+            except OSError:
+                pass
         raise RuntimeError(f"Failed to download {url}") from exc
+    remember_download(url, path)
+
+
+def fetch_static(
+    url: str,
+    css_selector: str,
+    user_agent: str = USER_AGENT,
+    *,
+    logger: logging.Logger | None = None,
+):
+    """Return the first element matching *css_selector* in the raw HTML of *url*.
+
+    ``None`` is returned when the request fails or the element is absent from
+    the served HTML, e.g. because the page is rendered by JavaScript.
+    """
+    log = logger or logging.getLogger(__name__)
+    try:
+        # Imported lazily to avoid mandatory dependency
+        from bs4 import BeautifulSoup
+    except ImportError:  # pragma: no cover - bs4 absent
+        return None
+    try:
+        import lxml  # noqa: F401
+        features = "lxml"
+    except ImportError:  # pragma: no cover - lxml absent
+        features = "html.parser"
+
+    try:
+        resp = get_session().get(url, headers={"User-Agent": user_agent}, timeout=10)
+        resp.raise_for_status()
+        soup = BeautifulSoup(resp.content, features)
+        return soup.select_one(css_selector)
+    except Exception as exc:  # noqa: BLE001
+        log.debug("Lecture statique de %s impossible : %s", url, exc)
+        return None
 
 
 def save_base64(encoded: str, path: Path) -> None:
@@ -37,22 +160,45 @@ def save_base64(encoded: str, path: Path) -> None:
     path.write_bytes(data)
 
 
+class PathReservations(set):
+    """Set of reserved paths that also remembers the next suffix per name.
+
+    Passing it to :func:`unique_path` lets repeated file names resume probing
+    where the previous call stopped instead of starting from ``_1`` again.
+    """
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.next_index: dict[Path, int] = {}
+
+
 def unique_path(folder: Path, filename: str, reserved: set[Path]) -> Path:
     """Return a unique ``Path`` in *folder* for *filename*."""
     base, ext = os.path.splitext(filename)
-    candidate = folder / filename
-    counter = 1
+    key = folder / filename
+    next_index = getattr(reserved, "next_index", None)
+    counter = next_index.get(key, 0) if next_index is not None else 0
+    candidate = key if counter == 0 else folder / f"{base}_{counter}{ext}"
     while candidate.exists() or candidate in reserved:
-        candidate = folder / f"{base}_{counter}{ext}"
         counter += 1
+        candidate = folder / f"{base}_{counter}{ext}"
     reserved.add(candidate)
+    if next_index is not None:
+        next_index[key] = counter + 1
     return candidate
 
 
 def handle_image(
-    element, folder: Path, index: int, user_agent: str, reserved: set[Path]
+    element,
+    folder: Path,
+    index: int,
+    user_agent: str,
+    reserved: set[Path],
+    *,
+    logger: logging.Logger | None = None,
 ) -> tuple[Path, str | None]:
     """Return target path and optional URL for *element* image."""
+    log = logger or logging.getLogger(__name__)
     src = (
         element.get_attribute("src")
         or element.get_attribute("data-src")
@@ -65,7 +211,7 @@ def handle_image(
         candidates = [s.strip().split(" ")[0] for s in src.split(",")]
         src = candidates[-1]
 
-    logger.debug("Téléchargement de l'image : %s", src)
+    log.debug("Téléchargement de l'image : %s", src)
 
     if src.startswith("data:image"):
         header, encoded = src.split(",", 1)
@@ -79,6 +225,6 @@ def handle_image(
         src = "https:" + src
 
     raw_filename = os.path.basename(src.split("?")[0])
-    filename = re.sub(r"-\d+(?=\.\w+$)", "", raw_filename)
+    filename = _SIZE_SUFFIX_RE.sub("", raw_filename)
     target = unique_path(folder, filename, reserved)
     return target, src
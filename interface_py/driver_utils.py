@@ -2,20 +2,49 @@ from __future__ import annotations
 
 """Utility helpers for Selenium WebDriver management."""
 
+import atexit
+import os
+import threading
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from pathlib import Path
 
 from settings_manager import SettingsManager, DEFAULT_SETTINGS
 
+# Drivers kept alive between calls when ``reuse=True``, keyed by headless mode
+_DRIVER_CACHE: dict[bool, webdriver.Chrome] = {}
+
+# Idle drivers handed out by ``acquire_driver``, keyed by headless mode
+_IDLE_DRIVERS: dict[bool, list[webdriver.Chrome]] = {}
+_POOL_MODES: dict[int, bool] = {}
+_POOL_LOCK = threading.Lock()
+_POOL_SIZE = int(os.environ.get("SCRAP_DRIVERS", "4"))
+
+# Parsed ``settings.json`` with the (mtime, size) it was read at
+_SETTINGS_CACHE: tuple[tuple[int, int] | None, dict] | None = None
+
+# ChromeDriver binary resolved by ``webdriver_manager`` on first use
+_DRIVER_PATH: str | None = None
+_DRIVER_PATH_LOCK = threading.Lock()
+
+
+def _is_alive(driver: webdriver.Chrome) -> bool:
+    """Return ``True`` if *driver* still answers WebDriver commands."""
+    try:
+        driver.title
+    except Exception:  # noqa: BLE001
+        return False
+    return True
+
 
 def setup_driver(
     headless: bool | None = None,
     driver_path: str | None = None,
     *,
     settings: SettingsManager | None = None,
+    reuse: bool = False,
 ) -> webdriver.Chrome:
     """Return a configured Chrome WebDriver.
 
@@ -30,12 +59,23 @@ def setup_driver(
     settings: SettingsManager | None
         Optional settings manager used to retrieve ``headless`` and ``driver_path``
         when not provided explicitly.
+    reuse: bool
+        Return the driver cached by a previous ``reuse=True`` call if it is
+        still alive. Cached drivers are closed by :func:`close_driver`.
     """
-    settings = settings or SettingsManager()
+    global _DRIVER_PATH
 
-    driver_path = driver_path or settings.settings.get("driver_path")
+    conf = settings.settings if settings is not None else _load_settings()
+
+    driver_path = driver_path or conf.get("driver_path")
     if headless is None:
-        headless = settings.settings.get("headless", DEFAULT_SETTINGS["headless"])
+        headless = conf.get("headless", DEFAULT_SETTINGS["headless"])
+    headless = bool(headless)
+
+    if reuse:
+        cached = _DRIVER_CACHE.get(headless)
+        if cached is not None and _is_alive(cached):
+            return cached
 
     options = Options()
     if headless:
@@ -49,7 +89,15 @@ def setup_driver(
     if driver_path and Path(driver_path).is_file():
         service = Service(str(driver_path))
     else:
-        service = Service(ChromeDriverManager().install())
+        if _DRIVER_PATH is None:
+            # Pooled drivers may start in parallel; resolve the binary once
+            with _DRIVER_PATH_LOCK:
+                if _DRIVER_PATH is None:
+                    # Imported lazily: only needed when no local driver is configured
+                    from webdriver_manager.chrome import ChromeDriverManager
+
+                    _DRIVER_PATH = ChromeDriverManager().install()
+        service = Service(_DRIVER_PATH)
     driver = webdriver.Chrome(service=service, options=options)
 
     # Hide webdriver flag
@@ -57,16 +105,99 @@ def setup_driver(
         "Page.addScriptToEvaluateOnNewDocument",
         {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"},
     )
+    if reuse:
+        _DRIVER_CACHE[headless] = driver
+    return driver
+
+
+def acquire_driver() -> webdriver.Chrome:
+    """Return an idle pooled driver, or a new one from :func:`setup_driver`.
+
+    Hand the driver back with :func:`release_driver` instead of quitting it
+    so that the next call skips the browser start-up.
+    """
+    headless = _load_headless_from_settings()
+    driver = None
+    while driver is None:
+        with _POOL_LOCK:
+            idle = _IDLE_DRIVERS.get(headless)
+            candidate = idle.pop() if idle else None
+        if candidate is None:
+            driver = setup_driver()
+        elif _is_alive(candidate):
+            driver = candidate
+        else:
+            _quit(candidate)
+    with _POOL_LOCK:
+        _POOL_MODES[id(driver)] = headless
     return driver
 
 
+def release_driver(driver: webdriver.Chrome) -> None:
+    """Reset *driver* and return it to the pool, or quit it if the pool is full."""
+    with _POOL_LOCK:
+        headless = _POOL_MODES.pop(id(driver), None)
+    if headless is None:
+        _quit(driver)
+        return
+    try:
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception:  # noqa: BLE001
+        _quit(driver)
+        return
+    with _POOL_LOCK:
+        idle = _IDLE_DRIVERS.setdefault(headless, [])
+        if len(idle) < _POOL_SIZE:
+            idle.append(driver)
+            return
+    _quit(driver)
+
+
+def _quit(driver: webdriver.Chrome) -> None:
+    try:
+        driver.quit()
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def close_driver() -> None:
+    """Quit every driver cached by :func:`setup_driver` or kept in the pool."""
+    for driver in _DRIVER_CACHE.values():
+        _quit(driver)
+    _DRIVER_CACHE.clear()
+    with _POOL_LOCK:
+        idle = [d for drivers in _IDLE_DRIVERS.values() for d in drivers]
+        _IDLE_DRIVERS.clear()
+    for driver in idle:
+        _quit(driver)
+
+
+atexit.register(close_driver)
+
+
+def _load_settings() -> dict:
+    """Return the default settings, re-read only when the file changes."""
+    global _SETTINGS_CACHE
+    path = Path("settings.json")
+    try:
+        st = path.stat()
+        stamp: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    cached = _SETTINGS_CACHE
+    if cached is None or cached[0] != stamp:
+        cached = _SETTINGS_CACHE = (stamp, SettingsManager(str(path)).settings)
+    return cached[1]
+
+
 def _load_headless_from_settings(manager: SettingsManager | None = None) -> bool:
     """Return the ``headless`` setting using :class:`SettingsManager`."""
-    manager = manager or SettingsManager()
-    return bool(manager.settings.get("headless", DEFAULT_SETTINGS["headless"]))
+    conf = manager.settings if manager is not None else _load_settings()
+    return bool(conf.get("headless", DEFAULT_SETTINGS["headless"]))
 
 
 def _load_driver_path_from_settings(manager: SettingsManager | None = None) -> str | None:
     """Return ChromeDriver path using :class:`SettingsManager`."""
-    manager = manager or SettingsManager()
-    return manager.settings.get("driver_path")
+    conf = manager.settings if manager is not None else _load_settings()
+    return conf.get("driver_path")
@@ -2,45 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import sys
-from typing import Iterable
-
-from bs4 import BeautifulSoup
-
-try:
-    from PySide6.QtWidgets import (
-        QApplication,
-        QMainWindow,
-        QWidget,
-        QVBoxLayout,
-        QLabel,
-        QPlainTextEdit,
-        QLineEdit,
-        QPushButton,
-    )
-except Exception:  # noqa: BLE001
-    QApplication = None  # type: ignore
-
-# Patterns of classes considered too generic or dynamic to use in a selector
-_BLACKLIST_PATTERNS = [
-    re.compile(pattern)
-    for pattern in (
-        r"^v-stack$",
-        r"^h-stack$",
-        r"^gap-",
-        r"^grid$",
-        r"^grid-",
-        r"^w-full$",
-        r"^h-full$",
-    )
-]
+import threading
+from typing import Callable, Iterable
+
+try:  # pragma: no cover - optional dependency
+    from lxml import etree as lxml_etree, html as lxml_html
+except ImportError:  # pragma: no cover - lxml absent
+    lxml_etree = lxml_html = None
+
+try:  # pragma: no cover - optional dependency
+    import xxhash
+except ImportError:  # pragma: no cover - xxhash absent
+    xxhash = None
+
+# Classes considered too generic or dynamic to use in a selector
+_BLACKLIST_RE = re.compile(r"^(?:v-stack|h-stack|gap-.*|grid|grid-.*|w-full|h-full)$")
 
 
 def _clean_classes(classes: Iterable[str] | None) -> list[str]:
     if not classes:
         return []
-    return [c for c in classes if not any(pat.search(c) for pat in _BLACKLIST_PATTERNS)]
+    match = _BLACKLIST_RE.match
+    return [c for c in classes if not match(c)]
 
 
 def _build_selector(a_tag) -> str:
@@ -58,32 +44,107 @@ def _build_selector(a_tag) -> str:
     return " ".join(reversed(parts))
 
 
+def _build_selector_lxml(a_elem) -> str:
+    """Same as :func:`_build_selector` for an ``lxml.html`` element."""
+    parts: list[str] = ["a"]
+    for parent in a_elem.iterancestors():
+        parent_id = parent.get("id")
+        if parent_id:
+            parts.append(f"{parent.tag}#{parent_id}")
+            break
+        classes = _clean_classes(parent.get("class", "").split())
+        if classes:
+            parts.append(f"{parent.tag}." + ".".join(classes))
+            break
+    return " ".join(reversed(parts))
+
+
+_TLS = threading.local()
+
+
+def _html_parser():
+    """Return this thread's ``lxml`` HTML parser, created on first use."""
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        parser = _TLS.parser = lxml_html.HTMLParser()
+    return parser
+
+
+def _find_anchors(html: str) -> tuple[list, Callable]:
+    """Return candidate ``<a>`` elements of *html* and their selector builder."""
+    if lxml_html is not None:
+        try:
+            tree = lxml_html.fromstring(html, parser=_html_parser())
+        except lxml_etree.ParserError:
+            return [], _build_selector_lxml
+        anchors = tree.xpath("descendant-or-self::a[@href != '' and normalize-space()]")
+        return anchors, _build_selector_lxml
+
+    # Imported lazily to avoid mandatory dependency when lxml is available
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    anchors = [
+        a
+        for a in soup.select("a[href]")
+        if a["href"] and a.get_text(strip=True)
+    ]
+    return anchors, _build_selector
+
+
+def _html_digest(html: str) -> int:
+    """Return a fast hash of *html* used as cache key."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(html)
+    return hash(html)
+
+
 def find_best_css_selector(html: str) -> str:
     """Return a CSS selector to locate product links in *html*.
 
     The selector targets ``<a>`` elements that contain text and an ``href``
     attribute. The function tries to keep the selector short while avoiding
-    overly generic classes.
+    overly generic classes. Results are cached for recently seen inputs.
     """
 
-    soup = BeautifulSoup(html, "html.parser")
-    anchors = [
-        a
-        for a in soup.find_all("a")
-        if a.get("href") and a.get_text(strip=True)
-    ]
+    return _find_cached(_html_digest(html), html)
+
+
+@functools.lru_cache(maxsize=32)
+def _find_cached(html_hash: int, html: str) -> str:  # noqa: ARG001
+    anchors, build_selector = _find_anchors(html)
     if not anchors:
         raise ValueError("No valid <a> tags found")
 
-    candidates = { _build_selector(a) for a in anchors }
-    return sorted(candidates, key=len)[0]
+    # Duplicates can never beat the current best with a strict ``<``, so the
+    # shortest selector is tracked inline without collecting candidates.
+    best = build_selector(anchors[0])
+    best_len = len(best)
+    for a in anchors[1:]:
+        selector = build_selector(a)
+        selector_len = len(selector)
+        if selector_len < best_len:
+            best, best_len = selector, selector_len
+    return best
 
 
 def run_gui() -> None:
     """Launch the PySide6 interface to test selectors."""
 
-    if QApplication is None:
-        raise RuntimeError("PySide6 is not installed")
+    try:
+        # Imported lazily so the command line path never loads Qt
+        from PySide6.QtWidgets import (
+            QApplication,
+            QMainWindow,
+            QWidget,
+            QVBoxLayout,
+            QLabel,
+            QPlainTextEdit,
+            QLineEdit,
+            QPushButton,
+        )
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError("PySide6 is not installed") from exc
 
     class MainWindow(QMainWindow):
         def __init__(self) -> None:
@@ -134,7 +195,8 @@ def run_gui() -> None:
     sys.exit(app.exec())
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Command line entry point."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -158,3 +220,6 @@ if __name__ == "__main__":
             content = sys.stdin.read()
         print(find_best_css_selector(content))
 
+
+if __name__ == "__main__":
+    main()
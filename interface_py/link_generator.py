@@ -6,6 +6,24 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QClipboard
 import sys
 
+# Extensions of the files listed by :func:`iter_image_names`
+IMAGE_EXTENSIONS = frozenset({".webp", ".jpg", ".jpeg", ".png"})
+
+
+def iter_image_names(root):
+    """Yield the names of the image files found under *root*, recursively."""
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_image_names(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                yield entry.name
+
+
 class WooImageURLGenerator(QWidget):
     def __init__(self):
         super().__init__()
@@ -70,21 +88,13 @@ class WooImageURLGenerator(QWidget):
         base_url = self.input_base_url.text().strip().rstrip("/")
         date_path = self.input_date.text().strip()
 
-        links = []
-        for root, _, files in os.walk(self.folder_path):
-            for file in files:
-                if file.lower().endswith((
-                    '.webp', '.jpg', '.jpeg', '.png'
-                )):
-                    file_url = (
-                        f"{base_url}/wp-content/uploads/{date_path}/{file}"
-                    )
-                    links.append(file_url)
+        prefix = f"{base_url}/wp-content/uploads/{date_path}/"
+        links = [prefix + name for name in iter_image_names(self.folder_path)]
 
         if links:
-            self.output_links.setText("\n".join(links))
+            self.output_links.setPlainText("\n".join(links))
         else:
-            self.output_links.setText("Aucune image valide trouv\u00e9e dans le dossier.")
+            self.output_links.setPlainText("Aucune image valide trouv\u00e9e dans le dossier.")
 
     def copy_to_clipboard(self):
         clipboard: QClipboard = QApplication.clipboard()
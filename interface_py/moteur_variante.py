@@ -1,29 +1,102 @@
 """Extract product variants from a web page."""
 from __future__ import annotations
 
-import random
 import time
 
 import argparse
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from interface_py.driver_utils import setup_driver
+from interface_py.driver_utils import acquire_driver, release_driver
+from interface_py.download_helpers import is_http_url
 from interface_py.constants import VARIANT_DEFAULT_SELECTOR
 
+# Results of :func:`extract_variants_with_images` keyed by URL, so that the
+# fetch and scrape workers do not load the same page twice in a row.
+_VARIANT_CACHE: OrderedDict[str, tuple[float, str, dict[str, str]]] = OrderedDict()
+_VARIANT_CACHE_LOCK = threading.Lock()
+_VARIANT_CACHE_SIZE = 64
+_VARIANT_CACHE_TTL = 120.0
 
-def extract_variants(url: str, selector: str = VARIANT_DEFAULT_SELECTOR) -> tuple[str, list[str]]:
+# Seconds allowed for the gallery image to change after a variant click
+_VARIANT_SWITCH_TIMEOUT = 5
+
+# Click every variant inside the page and collect the selected gallery image,
+# so the whole walk costs a single WebDriver round-trip.
+_VARIANT_IMAGES_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var timeout = arguments[0];
+var gallery = ".product-gallery__media.is-selected img";
+function currentSrc() {
+    var img = document.querySelector(gallery);
+    return img ? img.src : "";
+}
+function waitChange(old, name) {
+    return new Promise(function (resolve, reject) {
+        var timer;
+        var observer = new MutationObserver(check);
+        function check() {
+            var src = currentSrc();
+            if (src && src !== old) {
+                observer.disconnect();
+                clearTimeout(timer);
+                resolve(src);
+            }
+        }
+        // The selected slide changes either by class or by src swap
+        observer.observe(document.body, {
+            subtree: true, attributes: true,
+            attributeFilter: ["class", "src", "srcset"]
+        });
+        timer = setTimeout(function () {
+            observer.disconnect();
+            reject(name);
+        }, timeout);
+        check();
+    });
+}
+(async function () {
+    var container = document.querySelector(".variant-picker__option-values");
+    var inputs = container
+        ? container.querySelectorAll("input[type='radio'].sr-only") : [];
+    var results = [];
+    var seen = new Set();
+    for (var inp of inputs) {
+        var name = inp.value;
+        if (!name || seen.has(name)) { continue; }
+        seen.add(name);
+        var src = currentSrc();
+        if (!inp.checked) {
+            inp.click();
+            src = await waitChange(src, name);
+        }
+        results.push([name, src]);
+    }
+    return results;
+})().then(done, function (name) { done({error: String(name)}); });
+"""
+
+
+def extract_variants(
+    url: str,
+    selector: str = VARIANT_DEFAULT_SELECTOR,
+    *,
+    logger: logging.Logger | None = None,
+) -> tuple[str, list[str]]:
     """Return product title and list of variants found on *url*."""
-    if not url.lower().startswith(("http://", "https://")):
+    log = logger or logging.getLogger()
+    if not is_http_url(url):
         raise ValueError("URL must start with http:// or https://")
 
-    driver = setup_driver()
+    driver = acquire_driver()
     try:
-        logging.info("\U0001F310 Chargement de la page %s", url)
+        log.info("\U0001F310 Chargement de la page %s", url)
         driver.get(url)
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, selector))
@@ -31,20 +104,53 @@ def extract_variants(url: str, selector: str = VARIANT_DEFAULT_SELECTOR) -> tupl
         title = driver.find_element(By.CSS_SELECTOR, "h1").text.strip()
         elems = driver.find_elements(By.CSS_SELECTOR, selector)
         variants = [e.text.strip() for e in elems if e.text.strip()]
-        logging.info("\u2714\ufe0f %d variante(s) d\u00e9tect\u00e9e(s)", len(variants))
+        log.info("\u2714\ufe0f %d variante(s) d\u00e9tect\u00e9e(s)", len(variants))
         return title, variants
     finally:
-        driver.quit()
+        release_driver(driver)
+
 
+def extract_variants_with_images(
+    url: str,
+    *,
+    use_cache: bool = True,
+    logger: logging.Logger | None = None,
+) -> tuple[str, dict[str, str]]:
+    """Return product title and a mapping of variant name to image URL.
 
-def extract_variants_with_images(url: str) -> tuple[str, dict[str, str]]:
-    """Return product title and a mapping of variant name to image URL."""
-    if not url.lower().startswith(("http://", "https://")):
+    Results are kept for a short while so that a page already loaded by
+    another worker is not fetched again. ``use_cache=False`` always reloads
+    the page; the fresh result still replaces the cached one.
+    """
+    log = logger or logging.getLogger()
+    if not is_http_url(url):
         raise ValueError("URL must start with http:// or https://")
 
-    driver = setup_driver()
+    if use_cache:
+        now = time.monotonic()
+        with _VARIANT_CACHE_LOCK:
+            cached = _VARIANT_CACHE.get(url)
+            if cached and now - cached[0] < _VARIANT_CACHE_TTL:
+                _VARIANT_CACHE.move_to_end(url)
+                log.info("Variantes en cache pour %s", url)
+                return cached[1], dict(cached[2])
+
+    title, results = _fetch_variants_with_images(url, log)
+    with _VARIANT_CACHE_LOCK:
+        _VARIANT_CACHE[url] = (time.monotonic(), title, dict(results))
+        _VARIANT_CACHE.move_to_end(url)
+        while len(_VARIANT_CACHE) > _VARIANT_CACHE_SIZE:
+            _VARIANT_CACHE.popitem(last=False)
+    return title, results
+
+
+def _fetch_variants_with_images(
+    url: str, log: logging.Logger
+) -> tuple[str, dict[str, str]]:
+    """Load *url* in a browser and collect its variants and images."""
+    driver = acquire_driver()
     try:
-        logging.info("\U0001F310 Chargement de la page %s", url)
+        log.info("\U0001F310 Chargement de la page %s", url)
         driver.get(url)
         wait = WebDriverWait(driver, 10)
         wait.until(
@@ -52,59 +158,70 @@ def extract_variants_with_images(url: str) -> tuple[str, dict[str, str]]:
         )
         title = driver.find_element(By.CSS_SELECTOR, "h1").text.strip()
 
-        container = driver.find_element(By.CSS_SELECTOR, ".variant-picker__option-values")
-        inputs = container.find_elements(By.CSS_SELECTOR, "input[type='radio'].sr-only")
+        driver.set_script_timeout(120)
+        pairs = driver.execute_async_script(
+            _VARIANT_IMAGES_SCRIPT, _VARIANT_SWITCH_TIMEOUT * 1000
+        )
+        if isinstance(pairs, dict):
+            raise TimeoutError(
+                f"Gallery image did not change for variant {pairs.get('error')!r}"
+            )
 
         results: dict[str, str] = {}
-        for inp in inputs:
-            name = inp.get_attribute("value")
-            if not name or name in results:
-                continue
-
-            img_elem = driver.find_element(By.CSS_SELECTOR, ".product-gallery__media.is-selected img")
-            old_src = img_elem.get_attribute("src")
-
-            if inp.get_attribute("checked") is None:
-                driver.execute_script("arguments[0].click();", inp)
-                time.sleep(random.uniform(0.1, 0.2))
-                WebDriverWait(driver, 5).until(
-                    lambda d: d.find_element(By.CSS_SELECTOR, ".product-gallery__media.is-selected img").get_attribute("src") != old_src
-                )
-                img_elem = driver.find_element(By.CSS_SELECTOR, ".product-gallery__media.is-selected img")
-
-            src = img_elem.get_attribute("src")
+        for name, src in pairs or []:
             if src.startswith("//"):
                 src = "https:" + src
             results[name] = src
-            logging.info("%s -> %s", name, src)
+            log.info("%s -> %s", name, src)
 
         return title, results
     finally:
-        driver.quit()
+        release_driver(driver)
 
 
-def save_to_file(title: str, variants: list[str], path: Path) -> None:
+def save_to_file(
+    title: str,
+    variants: list[str],
+    path: Path,
+    *,
+    logger: logging.Logger | None = None,
+) -> None:
     """Write *title* and *variants* into *path* as a single line."""
+    log = logger or logging.getLogger()
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as fh:
         fh.write(f"{title}\t{', '.join(variants)}\n")
-    logging.info("\U0001F4BE Variantes enregistr\u00e9es dans %s", path)
+    log.info("\U0001F4BE Variantes enregistr\u00e9es dans %s", path)
 
 
-def save_images_to_file(title: str, variants: dict[str, str], path: Path) -> None:
+def save_images_to_file(
+    title: str,
+    variants: dict[str, str],
+    path: Path,
+    *,
+    logger: logging.Logger | None = None,
+) -> None:
     """Write *title* and variant/image pairs into *path*."""
+    log = logger or logging.getLogger()
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as fh:
         fh.write(f"{title}\n")
         for name, img in variants.items():
             fh.write(f"{name} : {img}\n")
-    logging.info("\U0001F4BE Variantes enregistr\u00e9es dans %s", path)
+    log.info("\U0001F4BE Variantes enregistr\u00e9es dans %s", path)
 
 
-def scrape_variants(url: str, selector: str, output: Path) -> None:
+def scrape_variants(
+    url: str,
+    selector: str,
+    output: Path,
+    *,
+    logger: logging.Logger | None = None,
+) -> None:
     """High level helper combining extraction and saving."""
-    title, variants = extract_variants(url, selector)
-    save_to_file(title, variants, output)
+    log = logger or logging.getLogger()
+    title, variants = extract_variants(url, selector, logger=log)
+    save_to_file(title, variants, output, logger=log)
 
 
 def main() -> None:
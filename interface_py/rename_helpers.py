@@ -9,6 +9,11 @@ from pathlib import Path
 
 from .download_helpers import unique_path
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - orjson absent
+    orjson = None
+
 # Path to the JSON file containing product names and ALT sentences
 ALT_JSON_PATH = Path(__file__).with_name("product_sentences.json")
 
@@ -17,43 +22,70 @@ USE_ALT_JSON = True
 
 logger = logging.getLogger(__name__)
 
-# Cache for the ALT sentences loaded from JSON
-_ALT_SENTENCES_CACHE: dict[Path, dict] = {}
+# Cache for the ALT sentences loaded from JSON, with the (mtime, size) read
+_ALT_SENTENCES_CACHE: dict[Path, tuple[tuple[int, int] | None, dict]] = {}
+
+_WS_RE = re.compile(r"\s+")
+# ``str.translate`` table dropping every ASCII character outside [a-z0-9_-]
+_KEEP_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+_DROP_TABLE = {c: None for c in range(128) if chr(c) not in _KEEP_CHARS}
 
 
-def load_alt_sentences(path: Path = ALT_JSON_PATH) -> dict:
-    """Load and cache ALT sentences from *path*."""
+def load_alt_sentences(
+    path: Path = ALT_JSON_PATH, *, logger: logging.Logger | None = None
+) -> dict:
+    """Load and cache ALT sentences from *path*, reloading it once changed."""
+    log = logger or logging.getLogger(__name__)
     path = Path(path)
+    try:
+        st = path.stat()
+        stamp: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
     cached = _ALT_SENTENCES_CACHE.get(path)
-    if cached is not None:
-        return cached
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     try:
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
     except Exception as exc:  # pragma: no cover - file missing or invalid
-        logger.warning("Impossible de charger %s : %s", path, exc)
+        log.warning("Impossible de charger %s : %s", path, exc)
         data = {}
-    _ALT_SENTENCES_CACHE[path] = data
+    _ALT_SENTENCES_CACHE[path] = (stamp, data)
     return data
 
 
 def clean_filename(text: str) -> str:
     """Return *text* transformed into a safe file name."""
-    normalized = unicodedata.normalize("NFD", text)
-    ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-    ascii_text = ascii_text.lower()
-    ascii_text = re.sub(r"\s+", "_", ascii_text)
-    ascii_text = re.sub(r"[^a-z0-9_-]", "", ascii_text)
+    if text.isascii():
+        # NFD and the ASCII round-trip leave pure ASCII text unchanged
+        ascii_text = text.lower()
+    else:
+        normalized = unicodedata.normalize("NFD", text)
+        ascii_text = normalized.encode("ascii", "ignore").decode("ascii").lower()
+    ascii_text = _WS_RE.sub("_", ascii_text)
+    ascii_text = ascii_text.translate(_DROP_TABLE)
     return ascii_text
 
 
-def rename_with_alt(path: Path, sentences: dict, warned: set[str], reserved: set[Path]) -> Path:
+def rename_with_alt(
+    path: Path,
+    sentences: dict,
+    warned: set[str],
+    reserved: set[Path],
+    *,
+    logger: logging.Logger | None = None,
+) -> Path:
     """Rename *path* using ALT sentences if available."""
+    log = logger or logging.getLogger(__name__)
     product_key = path.parent.name.replace("_", " ")
     phrase_list = sentences.get(product_key)
     if not phrase_list:
         if product_key not in warned:
-            logger.warning(
+            log.warning(
                 "Cle '%s' absente de product_sentences.json, pas de renommage",
                 product_key,
             )
@@ -68,6 +100,6 @@ def rename_with_alt(path: Path, sentences: dict, warned: set[str], reserved: set
     try:
         path.rename(target)
     except OSError as exc:  # pragma: no cover - rename failure
-        logger.warning("Echec du renommage %s -> %s : %s", path, target, exc)
+        log.warning("Echec du renommage %s -> %s : %s", path, target, exc)
         return path
     return target
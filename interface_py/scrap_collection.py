@@ -14,6 +14,7 @@ import csv
 import json
 import logging
 import random
+import textwrap
 import time
 from pathlib import Path
 from urllib.parse import urljoin
@@ -22,13 +23,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from interface_py.driver_utils import setup_driver
+from interface_py.driver_utils import acquire_driver, release_driver
+from interface_py.download_helpers import is_http_url
 from interface_py.constants import (
     COLLECTION_DEFAULT_SELECTOR,
     DEFAULT_NEXT_SELECTOR,
 )
 
-
+# Collect name and link of every match in a single WebDriver round-trip
+_LINKS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]), function (e) {
+    return [e.innerText || "", e.href || e.getAttribute("href")
+            || e.getAttribute("data-href") || ""];
+});
+"""
 
 
 def _random_sleep(min_s: float = 1.0, max_s: float = 2.5) -> None:
@@ -37,12 +45,50 @@ def _random_sleep(min_s: float = 1.0, max_s: float = 2.5) -> None:
     time.sleep(random.uniform(min_s, max_s))
 
 
+class _RowWriter:
+    """Write product rows to a file page by page in the requested format."""
+
+    def __init__(self, path: Path, output_format: str) -> None:
+        self.format = output_format
+        self.count = 0
+        if output_format == "csv":
+            self.fh = path.open("w", encoding="utf-8", newline="")
+            self.csv = csv.DictWriter(self.fh, fieldnames=["name", "url"])
+            self.csv.writeheader()
+        elif output_format == "json":
+            self.fh = path.open("w", encoding="utf-8")
+            self.fh.write("[")
+        else:
+            self.fh = path.open("w", encoding="utf-8-sig")
+
+    def write(self, rows: list[dict[str, str]]) -> None:
+        if self.format == "csv":
+            self.csv.writerows(rows)
+        elif self.format == "json":
+            # Same layout as ``json.dump(..., indent=2)`` on the whole list
+            for i, row in enumerate(rows, start=self.count):
+                item = json.dumps(row, ensure_ascii=False, indent=2)
+                self.fh.write(",\n" if i else "\n")
+                self.fh.write(textwrap.indent(item, "  "))
+        else:
+            self.fh.writelines(f"{row['name']} - {row['url']}\n" for row in rows)
+        self.count += len(rows)
+        self.fh.flush()
+
+    def close(self) -> None:
+        if self.format == "json":
+            self.fh.write("\n]" if self.count else "]")
+        self.fh.close()
+
+
 def scrape_collection(
     url: str,
     output_path: Path,
     css_selector: str = COLLECTION_DEFAULT_SELECTOR,
     next_selector: str = DEFAULT_NEXT_SELECTOR,
     output_format: str = "txt",
+    *,
+    logger: logging.Logger | None = None,
 ) -> None:
     """Scrape all products from *url* and save them in *output_path*.
 
@@ -50,40 +96,55 @@ def scrape_collection(
     pagination button. ``output_format`` controls the file format: ``txt``,
     ``json`` or ``csv``.
     """
+    log = logger or logging.getLogger()
+
+    log.info("Ouverture de la collection : %s", url)
+    if not is_http_url(url):
+        raise ValueError("URL invalide : seul http(s) est autorise")
 
-    driver = setup_driver()
-    results: list[dict[str, str]] = []
+    # Rows are written after each page so partial results survive an
+    # interruption and memory does not grow with the collection size. The
+    # file is only opened once the first page has been read, so a browser
+    # that fails to start leaves any previous output untouched.
+    writer: _RowWriter | None = None
+    driver = None
 
     try:
+        driver = acquire_driver()
         page_num = 1
 
-        logging.info("Ouverture de la collection : %s", url)
-        if not url.lower().startswith(("http://", "https://")):
-            raise ValueError("URL invalide : seul http(s) est autorise")
         driver.get(url)
         _random_sleep(2.0, 4.0)
+        # Checked once so the per-product trace below costs nothing at INFO.
+        trace = log.isEnabledFor(logging.DEBUG)
 
         while True:
-            logging.info("Traitement de la page %d", page_num)
+            log.info("Traitement de la page %d", page_num)
 
             WebDriverWait(driver, 10).until(
                 EC.presence_of_all_elements_located((By.CSS_SELECTOR, css_selector))
             )
-            elems = driver.find_elements(By.CSS_SELECTOR, css_selector)
+            links = driver.execute_script(_LINKS_SCRIPT, css_selector) or []
 
-            for el in elems:
-                name = el.get_attribute("innerText").strip()
-                href = el.get_attribute("href") or el.get_attribute("data-href") or ""
+            rows: list[dict[str, str]] = []
+            for name, href in links:
+                name = (name or "").strip()
+                href = href or ""
                 full_url = href if href.startswith("http") else urljoin(url, href)
-                results.append({"name": name, "url": full_url})
-                logging.debug("\u2192 %s : %s", name, full_url)
+                rows.append({"name": name, "url": full_url})
+                if trace:
+                    log.debug("\u2192 %s : %s", name, full_url)
+            if writer is None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                writer = _RowWriter(output_path, output_format)
+            writer.write(rows)
 
             try:
                 next_btn = driver.find_element(By.CSS_SELECTOR, next_selector)
                 next_href = next_btn.get_attribute("href")
                 if not next_href:
                     break
-                logging.info("\u2192 Page suivante detectee, navigation vers %s", next_href)
+                log.info("\u2192 Page suivante detectee, navigation vers %s", next_href)
                 current_url = driver.current_url
                 next_btn.click()
                 WebDriverWait(driver, 10).until(
@@ -92,28 +153,17 @@ def scrape_collection(
                 )
                 page_num += 1
             except Exception:
-                logging.info("\u2192 Pas de page suivante, fin de la pagination.")
+                log.info("\u2192 Pas de page suivante, fin de la pagination.")
                 break
     finally:
-        driver.quit()
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    if output_format == "json":
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
-    elif output_format == "csv":
-        with output_path.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["name", "url"])
-            writer.writeheader()
-            writer.writerows(results)
-    else:
-        with output_path.open("w", encoding="utf-8-sig") as f:
-            for row in results:
-                f.write(f"{row['name']} - {row['url']}\n")
-
-    logging.info(
+        if driver is not None:
+            release_driver(driver)
+        if writer is not None:
+            writer.close()
+
+    log.info(
         "\u2714\ufe0f %d produits sauvegardes dans %s",
-        len(results),
+        writer.count if writer is not None else 0,
         output_path,
     )
 
@@ -11,18 +11,38 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from interface_py.driver_utils import setup_driver
+from interface_py.driver_utils import acquire_driver, release_driver
+from interface_py.download_helpers import fetch_static, is_http_url
 from interface_py.constants import DESCRIPTION_DEFAULT_SELECTOR
 
 
 
 
-def extract_html_description(url: str, css_selector: str = DESCRIPTION_DEFAULT_SELECTOR) -> str:
-    """Return the inner HTML of the first element matching *css_selector* on *url*."""
-    if not url.lower().startswith(("http://", "https://")):
+def extract_html_description(
+    url: str,
+    css_selector: str = DESCRIPTION_DEFAULT_SELECTOR,
+    *,
+    static: bool = False,
+    logger: logging.Logger | None = None,
+) -> str:
+    """Return the inner HTML of the first element matching *css_selector* on *url*.
+
+    With *static*, the raw HTML is read first and the browser only starts
+    when the element is missing or empty there. The served HTML may differ
+    from the rendered page, so this is opt-in.
+    """
+    log = logger or logging.getLogger()
+    if not is_http_url(url):
         raise ValueError("URL must start with http:// or https://")
 
-    driver = setup_driver()
+    if static:
+        elem = fetch_static(url, css_selector, logger=log)
+        html = elem.decode_contents().strip() if elem is not None else ""
+        if html:
+            log.info("\u2714\ufe0f HTML extrait avec succès")
+            return html
+
+    driver = acquire_driver()
     try:
         driver.get(url)
         WebDriverWait(driver, 10).until(
@@ -30,23 +50,37 @@ def extract_html_description(url: str, css_selector: str = DESCRIPTION_DEFAULT_S
         )
         element = driver.find_element(By.CSS_SELECTOR, css_selector)
         html = element.get_attribute("innerHTML")
-        logging.info("\u2714\ufe0f HTML extrait avec succès")
+        log.info("\u2714\ufe0f HTML extrait avec succès")
         return html.strip()
     finally:
-        driver.quit()
+        release_driver(driver)
 
 
-def save_html_to_file(html: str, filename: Path = Path("description.html")) -> None:
+def save_html_to_file(
+    html: str,
+    filename: Path = Path("description.html"),
+    *,
+    logger: logging.Logger | None = None,
+) -> None:
     """Save *html* into *filename* encoded as UTF-8."""
+    log = logger or logging.getLogger()
     filename.parent.mkdir(parents=True, exist_ok=True)
     filename.write_text(html, encoding="utf-8")
-    logging.info("\U0001F4BE Description enregistrée dans %s", filename.resolve())
+    log.info("\U0001F4BE Description enregistrée dans %s", filename.resolve())
 
 
-def scrape_description(url: str, selector: str, output: Path) -> None:
+def scrape_description(
+    url: str,
+    selector: str,
+    output: Path,
+    *,
+    static: bool = False,
+    logger: logging.Logger | None = None,
+) -> None:
     """High level helper combining extraction and saving."""
-    html = extract_html_description(url, selector)
-    save_html_to_file(html, output)
+    log = logger or logging.getLogger()
+    html = extract_html_description(url, selector, static=static, logger=log)
+    save_html_to_file(html, output, logger=log)
 
 
 def main() -> None:
@@ -70,6 +104,11 @@ def main() -> None:
         default="description.html",
         help="Fichier de sortie (defaut: %(default)s)",
     )
+    parser.add_argument(
+        "--static",
+        action="store_true",
+        help="Lire d'abord le HTML brut, sans navigateur si possible",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -84,7 +123,7 @@ def main() -> None:
     logging.basicConfig(level=getattr(logging, args.log_level), format="%(levelname)s: %(message)s")
 
     try:
-        scrape_description(args.url, args.selector, Path(args.output))
+        scrape_description(args.url, args.selector, Path(args.output), static=args.static)
     except Exception as exc:
         logging.error("%s", exc)
 
@@ -11,16 +11,36 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from interface_py.driver_utils import setup_driver
+from interface_py.driver_utils import acquire_driver, release_driver
+from interface_py.download_helpers import fetch_static, is_http_url
 from interface_py.constants import PRICE_DEFAULT_SELECTOR
 
 
-def extract_price(url: str, css_selector: str = PRICE_DEFAULT_SELECTOR) -> str:
-    """Return the text content of the element matching *css_selector* on *url*."""
-    if not url.lower().startswith(("http://", "https://")):
+def extract_price(
+    url: str,
+    css_selector: str = PRICE_DEFAULT_SELECTOR,
+    *,
+    static: bool = False,
+    logger: logging.Logger | None = None,
+) -> str:
+    """Return the text content of the element matching *css_selector* on *url*.
+
+    With *static*, the raw HTML is read first and the browser only starts
+    when the element is missing or empty there. The served HTML may differ
+    from the rendered page, so this is opt-in.
+    """
+    log = logger or logging.getLogger()
+    if not is_http_url(url):
         raise ValueError("URL must start with http:// or https://")
 
-    driver = setup_driver()
+    if static:
+        elem = fetch_static(url, css_selector, logger=log)
+        price = elem.get_text().strip() if elem is not None else ""
+        if price:
+            log.info("\u2714\ufe0f Prix extrait avec succès")
+            return price
+
+    driver = acquire_driver()
     try:
         driver.get(url)
         WebDriverWait(driver, 10).until(
@@ -28,23 +48,37 @@ def extract_price(url: str, css_selector: str = PRICE_DEFAULT_SELECTOR) -> str:
         )
         element = driver.find_element(By.CSS_SELECTOR, css_selector)
         price = element.get_attribute("innerText")
-        logging.info("\u2714\ufe0f Prix extrait avec succès")
+        log.info("\u2714\ufe0f Prix extrait avec succès")
         return price.strip()
     finally:
-        driver.quit()
+        release_driver(driver)
 
 
-def save_price_to_file(price: str, filename: Path = Path("price.txt")) -> None:
+def save_price_to_file(
+    price: str,
+    filename: Path = Path("price.txt"),
+    *,
+    logger: logging.Logger | None = None,
+) -> None:
     """Save *price* into *filename* encoded as UTF-8."""
+    log = logger or logging.getLogger()
     filename.parent.mkdir(parents=True, exist_ok=True)
     filename.write_text(price, encoding="utf-8")
-    logging.info("\U0001F4BE Prix enregistré dans %s", filename.resolve())
+    log.info("\U0001F4BE Prix enregistré dans %s", filename.resolve())
 
 
-def scrape_price(url: str, selector: str, output: Path) -> None:
+def scrape_price(
+    url: str,
+    selector: str,
+    output: Path,
+    *,
+    static: bool = False,
+    logger: logging.Logger | None = None,
+) -> None:
     """High level helper combining extraction and saving."""
-    price = extract_price(url, selector)
-    save_price_to_file(price, output)
+    log = logger or logging.getLogger()
+    price = extract_price(url, selector, static=static, logger=log)
+    save_price_to_file(price, output, logger=log)
 
 
 def main() -> None:
@@ -68,6 +102,11 @@ def main() -> None:
         default="price.txt",
         help="Fichier de sortie (defaut: %(default)s)",
     )
+    parser.add_argument(
+        "--static",
+        action="store_true",
+        help="Lire d'abord le HTML brut, sans navigateur si possible",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -82,7 +121,7 @@ def main() -> None:
     logging.basicConfig(level=getattr(logging, args.log_level), format="%(levelname)s: %(message)s")
 
     try:
-        scrape_price(args.url, args.selector, Path(args.output))
+        scrape_price(args.url, args.selector, Path(args.output), static=args.static)
     except Exception as exc:  # noqa: BLE001
         logging.error("%s", exc)
 
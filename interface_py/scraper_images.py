@@ -8,7 +8,8 @@ import os
 import re
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -18,7 +19,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from tqdm import tqdm
 
-from interface_py.driver_utils import setup_driver
+from interface_py.driver_utils import acquire_driver, release_driver
 from settings_manager import SettingsManager, DEFAULT_SETTINGS
 from interface_py.constants import (
     IMAGES_DEFAULT_SELECTOR as DEFAULT_CSS_SELECTOR,
@@ -30,6 +31,27 @@ from . import rename_helpers
 logger = logging.getLogger(__name__)
 
 
+# Read the image attributes of every match in a single WebDriver round-trip
+_IMAGE_ATTRS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]), function (e) {
+    return [e.src || e.getAttribute("src"), e.getAttribute("data-src"),
+            e.getAttribute("data-srcset")];
+});
+"""
+
+
+class _ImageAttrs:
+    """Attributes of one image read in bulk, with the WebElement accessor."""
+
+    __slots__ = ("_attrs",)
+
+    def __init__(self, src: str | None, data_src: str | None, data_srcset: str | None) -> None:
+        self._attrs = {"src": src, "data-src": data_src, "data-srcset": data_srcset}
+
+    def get_attribute(self, name: str) -> str | None:
+        return self._attrs.get(name)
+
+
 def _safe_folder(product_name: str, base_dir: Path | str = "images") -> Path:
     """Return a Path where images will be saved."""
     safe_name = re.sub(r"[^\w\-]", "_", product_name)
@@ -38,8 +60,9 @@ def _safe_folder(product_name: str, base_dir: Path | str = "images") -> Path:
     return folder
 
 
-def _open_folder(path: Path) -> None:
+def _open_folder(path: Path, *, logger: logging.Logger | None = None) -> None:
     """Open *path* in the system file explorer if possible."""
+    log = logger or logging.getLogger(__name__)
     try:
         if os.name == "nt":
             os.startfile(path)  # type: ignore[attr-defined]
@@ -48,27 +71,29 @@ def _open_folder(path: Path) -> None:
         else:
             subprocess.Popen(["xdg-open", path])
     except Exception as exc:  # pragma: no cover - platform dependent
-        logger.warning("Impossible d'ouvrir le dossier %s : %s", path, exc)
+        log.warning("Impossible d'ouvrir le dossier %s : %s", path, exc)
+
+
+# First non-empty of og:title, then the rendered text of <title> and <h1>.
+# Elements that are not rendered count as empty, like WebElement.text.
+_PRODUCT_NAME_SCRIPT = """
+function shown(e) {
+    return e && e.getClientRects().length ? e.innerText.trim() : "";
+}
+var meta = document.querySelector("meta[property='og:title']");
+return (meta && (meta.content || "").trim())
+    || shown(document.querySelector("title"))
+    || shown(document.querySelector("h1"));
+"""
 
 
 def _find_product_name(driver: webdriver.Chrome) -> str:
     """Return the product name found in the page."""
-    selectors = [
-        (By.CSS_SELECTOR, "meta[property='og:title']", "content"),
-        (By.TAG_NAME, "title", None),
-        (By.TAG_NAME, "h1", None),
-    ]
-    for by, value, attr in selectors:
-        try:
-            elem = driver.find_element(by, value)
-            text = elem.get_attribute(attr) if attr else getattr(elem, "text", "")
-            if text:
-                text = text.strip()
-            if text:
-                return text
-        except Exception:
-            continue
-    return "produit_woo"
+    try:
+        text = driver.execute_script(_PRODUCT_NAME_SCRIPT)
+    except Exception:  # noqa: BLE001
+        text = None
+    return (text or "").strip() or "produit_woo"
 
 
 def download_images(
@@ -81,17 +106,26 @@ def download_images(
     *,
     alt_json_path: str | Path | None = None,
     max_threads: int = 4,
+    executor: Executor | None = None,
+    logger: logging.Logger | None = None,
+    first_image_callback: Optional[Callable[[Path], None]] = None,
 ) -> dict:
-    """Download all images from *url* and return folder and first image."""
-    reserved_paths: set[Path] = set()
+    """Download all images from *url* and return folder and first image.
+
+    When *executor* is given, downloads are submitted to it (at most
+    *max_threads* at a time) instead of a pool created for this call.
+    *first_image_callback* is called as soon as the first image is saved.
+    """
+    log = logger or logging.getLogger(__name__)
+    reserved_paths: set[Path] = dl_helpers.PathReservations()
     manager = SettingsManager()
     if user_agent is None:
         user_agent = manager.settings.get("user_agent", DEFAULT_SETTINGS["user_agent"])
 
-    if not url.lower().startswith(("http://", "https://")):
+    if not dl_helpers.is_http_url(url):
         raise ValueError("URL must start with http:// or https://")
 
-    driver = setup_driver()
+    driver = acquire_driver()
 
     product_name = ""
     folder = Path()
@@ -100,14 +134,16 @@ def download_images(
     skipped = 0
 
     if use_alt_json and alt_json_path:
-        sentences = rename_helpers.load_alt_sentences(Path(alt_json_path))
+        sentences = rename_helpers.load_alt_sentences(
+            Path(alt_json_path), logger=log
+        )
     else:
         sentences = {}
         use_alt_json = False
     warned_missing: set[str] = set()
 
     try:
-        logger.info("\U0001F30D Chargement de la page...")
+        log.info("\U0001F30D Chargement de la page...")
         driver.get(url)
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
@@ -116,9 +152,14 @@ def download_images(
         product_name = _find_product_name(driver)
         folder = _safe_folder(product_name, parent_dir)
 
-        img_elements = driver.find_elements(By.CSS_SELECTOR, css_selector)
-        logger.info(
-            f"\n\U0001F5BC {len(img_elements)} images trouvées avec le sélecteur : {css_selector}\n"
+        img_elements = [
+            _ImageAttrs(*attrs)
+            for attrs in driver.execute_script(_IMAGE_ATTRS_SCRIPT, css_selector) or []
+        ]
+        log.info(
+            "\n\U0001F5BC %d images trouvées avec le sélecteur : %s\n",
+            len(img_elements),
+            css_selector,
         )
 
         total = len(img_elements)
@@ -126,65 +167,89 @@ def download_images(
         pbar_update = getattr(pbar, "update", lambda n=1: None)
         pbar_close = getattr(pbar, "close", lambda: None)
         futures: dict = {}
+        submitted: set[str] = set()
+        duplicates: list[tuple[int, Path, str]] = []
 
-        with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        pool = executor or ThreadPoolExecutor(max_workers=max_threads)
+        slots = threading.BoundedSemaphore(max_threads)
+
+        def submit(idx: int, path: Path, src: str) -> None:
+            slots.acquire()
+            fut = pool.submit(dl_helpers.download_binary, src, path, user_agent)
+            fut.add_done_callback(lambda _f: slots.release())
+            futures[fut] = (idx, path, src)
+
+        try:
             for idx, img in enumerate(img_elements, start=1):
                 try:
                     path, url_to_download = dl_helpers.handle_image(
-                        img, folder, idx, user_agent, reserved_paths
-                    )
-                    WebDriverWait(driver, 5).until(
-                        lambda d: img.get_attribute("src")
-                        or img.get_attribute("data-src")
-                        or img.get_attribute("data-srcset")
+                        img, folder, idx, user_agent, reserved_paths, logger=log
                     )
                     if url_to_download is None:
                         if use_alt_json:
                             path = rename_helpers.rename_with_alt(
-                                path, sentences, warned_missing, reserved_paths
+                                path,
+                                sentences,
+                                warned_missing,
+                                reserved_paths,
+                                logger=log,
                             )
                         downloaded += 1
                         if first_image is None:
                             first_image = path
+                            if first_image_callback:
+                                first_image_callback(path)
                         pbar_update(1)
                         if progress_callback:
                             progress_callback(idx, total)
+                    elif url_to_download in submitted:
+                        # Copied from the first occurrence once it is saved
+                        duplicates.append((idx, path, url_to_download))
                     else:
-                        fut = executor.submit(
-                            dl_helpers.download_binary,
-                            url_to_download,
-                            path,
-                            user_agent,
-                        )
-                        futures[fut] = (idx, path)
+                        submitted.add(url_to_download)
+                        submit(idx, path, url_to_download)
                 except Exception as exc:  # pragma: no cover - unexpected
-                    logger.error("\u274c Erreur pour l'image %s : %s", idx, exc)
-            for fut in as_completed(futures):
-                idx, path = futures[fut]
-                try:
-                    fut.result()
-                    if use_alt_json:
-                        path = rename_helpers.rename_with_alt(
-                            path, sentences, warned_missing, reserved_paths
-                        )
-                    downloaded += 1
-                    if first_image is None:
-                        first_image = path
-                except Exception as exc:  # pragma: no cover - download failure
-                    logger.error("\u274c Erreur pour l'image %s : %s", idx, exc)
-                    skipped += 1
-                pbar_update(1)
-                if progress_callback:
-                    progress_callback(idx, total)
+                    log.error("\u274c Erreur pour l'image %s : %s", idx, exc)
+            while futures:
+                for fut in as_completed(list(futures)):
+                    idx, path, src = futures.pop(fut)
+                    try:
+                        fut.result()
+                        if use_alt_json:
+                            path = rename_helpers.rename_with_alt(
+                                path,
+                                sentences,
+                                warned_missing,
+                                reserved_paths,
+                                logger=log,
+                            )
+                            dl_helpers.remember_download(src, path)
+                        downloaded += 1
+                        if first_image is None:
+                            first_image = path
+                            if first_image_callback:
+                                first_image_callback(path)
+                    except Exception as exc:  # pragma: no cover - download failure
+                        log.error("\u274c Erreur pour l'image %s : %s", idx, exc)
+                        skipped += 1
+                    pbar_update(1)
+                    if progress_callback:
+                        progress_callback(idx, total)
+                for args in duplicates:
+                    submit(*args)
+                duplicates = []
+        finally:
+            if executor is None:
+                pool.shutdown()
         pbar_close()
     finally:
-        driver.quit()
-
-    logger.info("\n" + "-" * 50)
-    logger.info("\U0001F3AF Produit     : %s", product_name)
-    logger.info("\U0001F4E6 Dossier     : %s", folder)
-    logger.info("\u2705 Téléchargées : %s", downloaded)
-    logger.info("\u27A1️ Ignorées     : %s", skipped)
-    logger.info("-" * 50)
+        release_driver(driver)
+
+    log.info("\n" + "-" * 50)
+    log.info("\U0001F3AF Produit     : %s", product_name)
+    log.info("\U0001F4E6 Dossier     : %s", folder)
+    log.info("\u2705 Téléchargées : %s", downloaded)
+    log.info("\u27A1️ Ignorées     : %s", skipped)
+    log.info("-" * 50)
 
     return {"folder": folder, "first_image": first_image}
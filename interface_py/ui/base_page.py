@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit, QPushButton
 
 
@@ -18,6 +19,20 @@ class PageWithConsole(QWidget):
 
         self.log_view = QPlainTextEdit(readOnly=True)
         self.main_layout.addWidget(self.log_view)
+        self._pending_logs: list[str] = []
+
+    def append_log(self, message: str) -> None:
+        """Queue ``message`` and flush all pending lines in one update."""
+        if not self._pending_logs:
+            QTimer.singleShot(0, self._flush_logs)
+        self._pending_logs.append(message)
+
+    def _flush_logs(self) -> None:
+        if not self._pending_logs:
+            return
+        text = "\n".join(self._pending_logs)
+        self._pending_logs.clear()
+        self.log_view.appendPlainText(text)
 
     def toggle_console(self) -> None:
         visible = self.log_view.isVisible()
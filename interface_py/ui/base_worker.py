@@ -7,8 +7,23 @@ from PySide6.QtCore import QThread, Signal
 from .widgets import QtLogHandler
 
 
+def _make_logger(signal, log_level: str = "INFO") -> logging.Logger:
+    """Return a private logger forwarding its records to *signal*.
+
+    The logger is not registered with :mod:`logging` and does not propagate,
+    so concurrent workers never share handlers or see each other's records.
+    """
+    logger = logging.Logger(f"scrap.worker.{id(signal):x}")
+    logger.setLevel(getattr(logging, log_level, logging.INFO))
+    logger.propagate = False
+    handler = QtLogHandler(signal)
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    logger.addHandler(handler)
+    return logger
+
+
 class BaseWorker(QThread):
-    """Thread worker providing basic logging setup and cleanup."""
+    """Thread worker owning a dedicated logger connected to :attr:`log`."""
 
     log = Signal(str)
     finished = Signal()
@@ -16,29 +31,16 @@ class BaseWorker(QThread):
     def __init__(self, log_level: str = "INFO") -> None:
         super().__init__()
         self.log_level = log_level
+        self.logger = _make_logger(self.log, log_level)
 
     def run(self) -> None:  # noqa: D401
-        logger, handler = self._setup_logger()
         try:
             self.work()
         except Exception as exc:  # noqa: BLE001
-            logger.error("%s", exc)
+            self.logger.error("%s", exc)
         finally:
-            self._cleanup_logger(logger, handler)
             self.finished.emit()
 
-    def _setup_logger(self) -> tuple[logging.Logger, logging.Handler]:
-        logger = logging.getLogger()
-        logger.setLevel(getattr(logging, self.log_level, logging.INFO))
-        handler = QtLogHandler(self.log)
-        formatter = logging.Formatter("%(levelname)s: %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        return logger, handler
-
-    def _cleanup_logger(self, logger: logging.Logger, handler: logging.Handler) -> None:
-        logger.removeHandler(handler)
-
     def work(self) -> None:
         """Override in subclasses to perform actual processing."""
         raise NotImplementedError
@@ -74,7 +74,7 @@ class PageScrapLienCollection(PageWithConsole):
         self.save_fields()
 
         self.worker = ScrapLienWorker(url, output, selector, log_level, output_format)
-        self.worker.log.connect(self.log_view.appendPlainText)
+        self.worker.log.connect(self.append_log)
         self.worker.finished.connect(self.on_finished)
         self.worker.start()
 
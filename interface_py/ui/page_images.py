@@ -19,7 +19,10 @@ from PySide6.QtWidgets import (
 
 from settings_manager import SettingsManager
 from gui.workers import ScraperImagesWorker
-from interface_py.constants import IMAGES_DEFAULT_SELECTOR as DEFAULT_CSS_SELECTOR
+from interface_py.constants import (
+    IMAGES_DEFAULT_SELECTOR as DEFAULT_CSS_SELECTOR,
+    MAX_DOWNLOAD_THREADS,
+)
 
 from .base_page import PageWithConsole
 from .widgets import ToggleSwitch
@@ -69,7 +72,7 @@ class PageScraperImages(PageWithConsole):
         label_alt_json.hide()
 
         self.spin_threads = QSpinBox()
-        self.spin_threads.setRange(1, 32)
+        self.spin_threads.setRange(1, MAX_DOWNLOAD_THREADS)
         self.spin_threads.setValue(manager.settings.get("images_max_threads", 4))
         layout.addWidget(QLabel("Threads parallèles"))
         layout.addWidget(self.spin_threads)
@@ -162,7 +165,7 @@ class PageScraperImages(PageWithConsole):
             alt_json,
             self.spin_threads.value(),
         )
-        self.worker.log.connect(self.log_view.appendPlainText)
+        self.worker.log.connect(self.append_log)
         self.worker.progress.connect(self.update_progress)
         self.worker.preview_path.connect(self.display_preview)
         self.worker.finished.connect(self.on_finished)
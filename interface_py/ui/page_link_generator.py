@@ -17,6 +17,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QClipboard
 
 from settings_manager import SettingsManager
+from interface_py.link_generator import iter_image_names
 
 
 class PageLinkGenerator(QWidget):
@@ -81,17 +82,13 @@ class PageLinkGenerator(QWidget):
         base_url = self.input_base_url.text().strip().rstrip("/")
         date_path = self.input_date.text().strip()
 
-        links: list[str] = []
-        for root, _, files in os.walk(self.folder_path):
-            for fname in files:
-                if fname.lower().endswith((".webp", ".jpg", ".jpeg", ".png")):
-                    file_url = f"{base_url}/wp-content/uploads/{date_path}/{fname}"
-                    links.append(file_url)
+        prefix = f"{base_url}/wp-content/uploads/{date_path}/"
+        links = [prefix + name for name in iter_image_names(self.folder_path)]
 
         if links:
-            self.output_links.setText("\n".join(links))
+            self.output_links.setPlainText("\n".join(links))
         else:
-            self.output_links.setText("Aucune image valide trouvée dans le dossier.")
+            self.output_links.setPlainText("Aucune image valide trouvée dans le dossier.")
         QMessageBox.information(self, "Terminé", "La génération des liens est terminée.")
 
     def copy_to_clipboard(self) -> None:
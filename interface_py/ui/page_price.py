@@ -57,7 +57,7 @@ class PageScrapPrice(PageWithConsole):
         self.save_fields()
 
         self.worker = ScrapPriceWorker(url, selector, output)
-        self.worker.log.connect(self.log_view.appendPlainText)
+        self.worker.log.connect(self.append_log)
         self.worker.finished.connect(self.on_finished)
         self.worker.start()
 
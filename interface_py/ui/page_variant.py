@@ -75,7 +75,7 @@ class PageVariantScraper(PageWithConsole):
         self.log_view.clear()
         self.save_fields()
         self.worker = ScrapVariantWorker(url, selector, output)
-        self.worker.log.connect(self.log_view.appendPlainText)
+        self.worker.log.connect(self.append_log)
         self.worker.finished.connect(self.on_finished)
         self.worker.start()
 
@@ -92,6 +92,9 @@ class QtLogHandler(logging.Handler):
 class ToggleSwitch(QCheckBox):
     """Simple ON/OFF switch widget."""
 
+    # (on, off, knob) colours, parsed once on first paint
+    _colors: tuple | None = None
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._offset = 2
@@ -114,9 +117,12 @@ class ToggleSwitch(QCheckBox):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor("#4cd964" if self.isChecked() else "#bbbbbb"))
+        if ToggleSwitch._colors is None:
+            ToggleSwitch._colors = (QColor("#4cd964"), QColor("#bbbbbb"), QColor("white"))
+        on, off, knob = ToggleSwitch._colors
+        painter.setBrush(on if self.isChecked() else off)
         painter.drawRoundedRect(0, 0, self.width(), self.height(), radius, radius)
-        painter.setBrush(QColor("white"))
+        painter.setBrush(knob)
         painter.drawEllipse(QRect(self._offset, 2, self.height() - 4, self.height() - 4))
 
 
@@ -20,13 +20,15 @@ class DummyTextEdit:
     def __init__(self, *args, **kwargs):
         self._text = ""
     def append(self, txt):
-        self._text += txt + "\n"
+        self._text = f"{self._text}\n{txt}" if self._text else txt
     def clear(self):
         self._text = ""
     def toPlainText(self):
         return self._text
     def setText(self, txt):
         self._text = txt
+    def setPlainText(self, txt):
+        self._text = txt
 
 class DummyLineEdit:
     def __init__(self, txt=""):
@@ -127,6 +129,7 @@ def setup_pyside(monkeypatch):
     qtcore.QThread = DummyThread
     qtcore.Signal = DummySignal
     qtcore.QObject = DummyQObject
+    qtcore.QTimer = type("QTimer", (), {})
 
     pyside = types.ModuleType("PySide6")
     pyside.QtWidgets = qtwidgets
@@ -150,11 +153,11 @@ def load_module(monkeypatch):
 def test_start_analysis_success(monkeypatch):
     mod = load_module(monkeypatch)
 
-    def fake_extract(url):
+    def fake_extract(url, use_cache=True, logger=None):
         assert url == "http://ex"
+        assert use_cache is False
         return "Title", {"Red": "https://a/red.jpg", "Blue": "https://a/blue.png"}
 
-    monkeypatch.setattr(mod.moteur_variante, "extract_variants_with_images", fake_extract)
     gw = __import__("gui.workers", fromlist=["dummy"])
     monkeypatch.setattr(gw.moteur_variante, "extract_variants_with_images", fake_extract)
 
@@ -188,10 +191,9 @@ def test_start_analysis_success(monkeypatch):
 def test_start_analysis_error(monkeypatch):
     mod = load_module(monkeypatch)
 
-    def fake_extract(url):
+    def fake_extract(url, use_cache=True, logger=None):
         raise ValueError("boom")
 
-    monkeypatch.setattr(mod.moteur_variante, "extract_variants_with_images", fake_extract)
 
     gw = __import__("gui.workers", fromlist=["dummy"])
     monkeypatch.setattr(gw.moteur_variante, "extract_variants_with_images", fake_extract)
@@ -218,6 +220,18 @@ def test_build_wp_url_strip_digits(monkeypatch):
     )
 
 
+def test_strip_size_suffix(monkeypatch):
+    mod = load_module(monkeypatch)
+    strip = mod.AlphaEngine._strip_size_suffix
+
+    assert strip("photo-800.jpg") == "photo.jpg"
+    assert strip("photo-12-34.webp") == "photo-12.webp"
+    assert strip("photo800.jpg") == "photo800.jpg"
+    assert strip("photo-.jpg") == "photo-.jpg"
+    assert strip("photo-12") == "photo-12"
+    assert strip("photo-12.") == "photo-12."
+
+
 def test_export_csv(monkeypatch, tmp_path):
     mod = load_module(monkeypatch)
     eng = mod.AlphaEngine()
@@ -230,20 +244,97 @@ def test_export_csv(monkeypatch, tmp_path):
 
     monkeypatch.setattr(mod.QFileDialog, "getSaveFileName", staticmethod(fake_get))
 
-    calls = {}
+    eng.export_csv()
 
-    class DummyPandas:
-        class DataFrame:
-            def __init__(self, data):
-                calls["data"] = data
-            def to_csv(self, path, index=False):
-                calls["path"] = path
-                calls["index"] = index
+    lines = (tmp_path / "out.csv").read_text(encoding="utf-8").splitlines()
+    assert lines == ["Product,Variant,Image", "T,V,L"]
 
-    monkeypatch.setitem(sys.modules, "pandas", DummyPandas)
 
-    eng.export_csv()
+def test_export_excel(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch)
+    eng = mod.AlphaEngine()
+    eng._export_rows = [
+        {"Product": "T", "Variant": "V", "Image": "L"},
+    ]
+
+    def fake_get(*a, **k):
+        return str(tmp_path / "out.xlsx"), ""
+
+    monkeypatch.setattr(mod.QFileDialog, "getSaveFileName", staticmethod(fake_get))
+
+    calls = {"rows": []}
+
+    class DummySheet:
+        def write_row(self, row, col, data):
+            calls["rows"].append((row, col, list(data)))
+
+    class DummyWorkbook:
+        def __init__(self, path, options):
+            calls["path"] = path
+            calls["options"] = options
 
-    assert calls["data"] == eng._export_rows
-    assert calls["path"] == str(tmp_path / "out.csv")
-    assert calls["index"] is False
+        def add_worksheet(self):
+            return DummySheet()
+
+        def close(self):
+            calls["closed"] = True
+
+    xlsxwriter = types.ModuleType("xlsxwriter")
+    xlsxwriter.Workbook = DummyWorkbook
+    monkeypatch.setitem(sys.modules, "xlsxwriter", xlsxwriter)
+
+    eng.export_excel()
+
+    assert calls["path"] == str(tmp_path / "out.xlsx")
+    assert calls["options"]["constant_memory"] is True
+    assert calls["rows"] == [
+        (0, 0, ["Product", "Variant", "Image"]),
+        (1, 0, ["T", "V", "L"]),
+    ]
+    assert calls["closed"] is True
+
+
+def test_export_parquet_and_feather(monkeypatch, tmp_path):
+    mod = load_module(monkeypatch)
+    eng = mod.AlphaEngine()
+    eng._export_rows = [
+        {"Product": "T", "Variant": "V", "Image": "L"},
+    ]
+
+    calls = []
+
+    pyarrow = types.ModuleType("pyarrow")
+    pyarrow.string = lambda: "string"
+    pyarrow.schema = lambda fields: list(fields)
+
+    class DummyTable:
+        @staticmethod
+        def from_pylist(rows, schema=None):
+            return ("table", tuple(map(tuple, (r.items() for r in rows))))
+
+    pyarrow.Table = DummyTable
+    feather = types.ModuleType("pyarrow.feather")
+    feather.write_feather = lambda table, path: calls.append(("feather", path, table))
+    parquet = types.ModuleType("pyarrow.parquet")
+    parquet.write_table = lambda table, path, compression=None: calls.append(
+        ("parquet", path, compression)
+    )
+    pyarrow.feather = feather
+    pyarrow.parquet = parquet
+    monkeypatch.setitem(sys.modules, "pyarrow", pyarrow)
+    monkeypatch.setitem(sys.modules, "pyarrow.feather", feather)
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", parquet)
+    monkeypatch.setitem(sys.modules, "pandas", None)
+
+    for name in ("out.parquet", "out.feather"):
+        target = str(tmp_path / name)
+        monkeypatch.setattr(
+            mod.QFileDialog, "getSaveFileName", staticmethod(lambda *a, t=target, **k: (t, ""))
+        )
+        eng.export_parquet()
+
+    table = ("table", ((("Product", "T"), ("Variant", "V"), ("Image", "L")),))
+    assert calls == [
+        ("parquet", str(tmp_path / "out.parquet"), "zstd"),
+        ("feather", str(tmp_path / "out.feather"), table),
+    ]
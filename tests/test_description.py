@@ -37,12 +37,29 @@ def test_extract_html_description(monkeypatch):
     monkeypatch.setattr(sdp, "WebDriverWait", DummyWait)
     monkeypatch.setattr(sdp, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: DummyDriver())
-    monkeypatch.setattr(sdp, "setup_driver", lambda: DummyDriver())
+    monkeypatch.setattr(sdp, "fetch_static", lambda url, selector, **k: None)
 
     html = sdp.extract_html_description("https://example.com", "div")
     assert html == "<p>desc</p>"
 
 
+def test_extract_html_description_static_is_opt_in(monkeypatch):
+    class StaticElement:
+        def decode_contents(self):
+            return "<p>stale</p>"
+
+    monkeypatch.setattr(sdp, "WebDriverWait", DummyWait)
+    monkeypatch.setattr(sdp, "EC", DummyEC)
+    monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: DummyDriver())
+    monkeypatch.setattr(sdp, "fetch_static", lambda url, selector, **k: StaticElement())
+
+    assert sdp.extract_html_description("https://example.com", "div") == "<p>desc</p>"
+    assert (
+        sdp.extract_html_description("https://example.com", "div", static=True)
+        == "<p>stale</p>"
+    )
+
+
 def test_save_html_to_file_creates_parent(tmp_path):
     dest = tmp_path / "sub" / "desc.html"
     sdp.save_html_to_file("<p>test</p>", dest)
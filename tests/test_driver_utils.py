@@ -1,4 +1,5 @@
 import importlib
+import sys
 from pathlib import Path
 
 import interface_py.driver_utils as driver_utils
@@ -34,7 +35,7 @@ def test_setup_driver_with_path(tmp_path, monkeypatch):
     monkeypatch.setattr(driver_utils, "Service", DummyService)
     monkeypatch.setattr(driver_utils, "Options", DummyOptions)
     monkeypatch.setattr(driver_utils.webdriver, "Chrome", lambda service, options: DummyDriver(), raising=False)
-    monkeypatch.setattr(driver_utils, "ChromeDriverManager", DummyCDM)
+    monkeypatch.setattr(sys.modules["webdriver_manager.chrome"], "ChromeDriverManager", DummyCDM)
 
     driver = driver_utils.setup_driver(driver_path=str(chromedriver))
 
@@ -61,11 +62,120 @@ def test_setup_driver_download(monkeypatch):
 
     monkeypatch.setattr(driver_utils, "Service", DummyService)
     monkeypatch.setattr(driver_utils, "Options", DummyOptions)
-    monkeypatch.setattr(driver_utils, "ChromeDriverManager", DummyCDM)
+    monkeypatch.setattr(sys.modules["webdriver_manager.chrome"], "ChromeDriverManager", DummyCDM)
     monkeypatch.setattr(driver_utils.webdriver, "Chrome", lambda service, options: DummyDriver(), raising=False)
+    monkeypatch.setattr(driver_utils, "_DRIVER_PATH", None)
 
     driver = driver_utils.setup_driver(driver_path="/does/not/exist")
 
     assert isinstance(driver, DummyDriver)
     assert calls["install"] is True
     assert calls["path"] == "/tmp/cd"
+
+
+def test_setup_driver_reuse(monkeypatch):
+    calls = {"install": 0, "quit": 0}
+
+    class DummyService:
+        def __init__(self, path):
+            pass
+
+    class DummyCDM:
+        def install(self):
+            calls["install"] += 1
+            return "/tmp/cd"
+
+    class DummyDriver:
+        title = ""
+
+        def execute_cdp_cmd(self, *a, **k):
+            pass
+
+        def quit(self):
+            calls["quit"] += 1
+
+    monkeypatch.setattr(driver_utils, "Service", DummyService)
+    monkeypatch.setattr(driver_utils, "Options", DummyOptions)
+    monkeypatch.setattr(sys.modules["webdriver_manager.chrome"], "ChromeDriverManager", DummyCDM)
+    monkeypatch.setattr(driver_utils.webdriver, "Chrome", lambda service, options: DummyDriver(), raising=False)
+    monkeypatch.setattr(driver_utils, "_DRIVER_PATH", None)
+    monkeypatch.setattr(driver_utils, "_DRIVER_CACHE", {})
+
+    first = driver_utils.setup_driver(True, "/does/not/exist", reuse=True)
+    second = driver_utils.setup_driver(True, "/does/not/exist", reuse=True)
+    other = driver_utils.setup_driver(True, "/does/not/exist")
+
+    assert first is second
+    assert other is not first
+    assert calls["install"] == 1
+
+    driver_utils.close_driver()
+    assert calls["quit"] == 1
+    assert driver_utils._DRIVER_CACHE == {}
+
+
+def test_acquire_driver_pool(monkeypatch):
+    calls = {"created": 0, "quit": 0, "reset": []}
+
+    class DummyDriver:
+        title = ""
+
+        def delete_all_cookies(self):
+            calls["reset"].append("cookies")
+
+        def get(self, url):
+            calls["reset"].append(url)
+
+        def quit(self):
+            calls["quit"] += 1
+
+    def fake_setup():
+        calls["created"] += 1
+        return DummyDriver()
+
+    monkeypatch.setattr(driver_utils, "setup_driver", fake_setup)
+    monkeypatch.setattr(driver_utils, "_load_headless_from_settings", lambda: True)
+    monkeypatch.setattr(driver_utils, "_IDLE_DRIVERS", {})
+    monkeypatch.setattr(driver_utils, "_POOL_MODES", {})
+    monkeypatch.setattr(driver_utils, "_DRIVER_CACHE", {})
+    monkeypatch.setattr(driver_utils, "_POOL_SIZE", 1)
+
+    first = driver_utils.acquire_driver()
+    driver_utils.release_driver(first)
+    second = driver_utils.acquire_driver()
+    third = driver_utils.acquire_driver()
+
+    assert second is first
+    assert third is not first
+    assert calls["created"] == 2
+    assert calls["reset"] == ["cookies", "about:blank"]
+
+    driver_utils.release_driver(second)
+    driver_utils.release_driver(third)
+    assert calls["quit"] == 1
+
+    driver_utils.close_driver()
+    assert calls["quit"] == 2
+    assert driver_utils._IDLE_DRIVERS == {}
+
+
+def test_load_settings_cached_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(driver_utils, "_SETTINGS_CACHE", None)
+    loads = []
+    real_manager = driver_utils.SettingsManager
+
+    def counting_manager(*args, **kwargs):
+        loads.append(1)
+        return real_manager(*args, **kwargs)
+
+    monkeypatch.setattr(driver_utils, "SettingsManager", counting_manager)
+
+    assert driver_utils._load_headless_from_settings() is True
+    assert driver_utils._load_driver_path_from_settings() == ""
+    assert len(loads) == 1
+
+    (tmp_path / "settings.json").write_text('{"headless": false}', encoding="utf-8")
+    assert driver_utils._load_headless_from_settings() is False
+    assert driver_utils._load_headless_from_settings() is False
+    assert len(loads) == 2
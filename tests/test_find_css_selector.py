@@ -0,0 +1,69 @@
+import importlib
+
+import pytest
+
+pytest.importorskip("bs4")
+fcs = importlib.import_module("interface_py.find_css_selector")
+
+HTML = """
+<div class="grid products">
+  <div class="card w-full"><h3 class="title"><a href="/p1">P1</a></h3></div>
+  <div class="card w-full"><h3 class="title"><a href="/p2">P2</a></h3></div>
+  <section id="promo"><a href="/x">X</a></section>
+  <div class="v-stack"><a href="">empty</a></div>
+</div>
+"""
+
+
+@pytest.mark.parametrize("use_lxml", [True, False])
+def test_find_best_css_selector(monkeypatch, use_lxml):
+    if use_lxml and fcs.lxml_html is None:
+        pytest.skip("lxml not installed")
+    if not use_lxml:
+        monkeypatch.setattr(fcs, "lxml_html", None)
+    fcs._find_cached.cache_clear()
+
+    assert fcs.find_best_css_selector(HTML) == "h3.title a"
+
+
+def test_find_best_css_selector_no_anchor():
+    with pytest.raises(ValueError):
+        fcs.find_best_css_selector("<p>nothing</p>")
+
+
+def test_clean_classes_blacklist():
+    classes = ["v-stack", "gap-4", "grid", "grid-cols-2", "card", "w-full"]
+    assert fcs._clean_classes(classes) == ["card"]
+
+
+def test_find_best_css_selector_cached(monkeypatch):
+    fcs._find_cached.cache_clear()
+    calls = []
+    original = fcs._find_anchors
+
+    def counting(html):
+        calls.append(html)
+        return original(html)
+
+    monkeypatch.setattr(fcs, "_find_anchors", counting)
+
+    first = fcs.find_best_css_selector(HTML)
+    second = fcs.find_best_css_selector(HTML)
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_html_parser_is_thread_local():
+    if fcs.lxml_html is None:
+        pytest.skip("lxml not installed")
+    import threading
+
+    main = fcs._html_parser()
+    other = []
+    t = threading.Thread(target=lambda: other.append(fcs._html_parser()))
+    t.start()
+    t.join()
+
+    assert fcs._html_parser() is main
+    assert other[0] is not main
@@ -53,6 +53,9 @@ class DummyTextEdit:
     def setText(self, text):
         self._text = text
 
+    def setPlainText(self, text):
+        self._text = text
+
     def toPlainText(self):
         return self._text
 
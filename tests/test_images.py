@@ -1,6 +1,9 @@
 import importlib
+import sys
+import types
 from pathlib import Path
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 si = importlib.import_module("interface_py.scraper_images")
 dh = importlib.import_module("interface_py.download_helpers")
@@ -54,6 +57,12 @@ class DummyDriver:
     def find_elements(self, by, selector):
         return self.elems
 
+    def execute_script(self, script, selector):
+        return [
+            [e.get_attribute("src"), e.get_attribute("data-src"), e.get_attribute("data-srcset")]
+            for e in self.elems
+        ]
+
     def quit(self):
         self.closed = True
 
@@ -79,7 +88,6 @@ def test_download_images_datasrc_progress(tmp_path, monkeypatch):
     monkeypatch.setattr(si, "WebDriverWait", DummyWait)
     monkeypatch.setattr(si, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: driver)
-    monkeypatch.setattr(si, "setup_driver", lambda: driver)
     monkeypatch.setattr(si, "_find_product_name", lambda d: "prod")
 
     def fake_download(url, dest, ua):
@@ -109,7 +117,6 @@ def test_download_images_parallel(tmp_path, monkeypatch):
     monkeypatch.setattr(si, "WebDriverWait", DummyWait)
     monkeypatch.setattr(si, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: driver)
-    monkeypatch.setattr(si, "setup_driver", lambda: driver)
     monkeypatch.setattr(si, "_find_product_name", lambda d: "prod")
 
     def fake_download(url, dest, ua):
@@ -132,6 +139,35 @@ def test_download_images_parallel(tmp_path, monkeypatch):
     assert len(list(res["folder"].iterdir())) == 2
 
 
+def test_download_images_shared_executor(tmp_path, monkeypatch):
+    elems = [ElementDataSrc(), ElementDataSrc(), ElementDataSrc()]
+    driver = DummyDriver(elems)
+
+    monkeypatch.setattr(si, "WebDriverWait", DummyWait)
+    monkeypatch.setattr(si, "EC", DummyEC)
+    monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: driver)
+    monkeypatch.setattr(si, "_find_product_name", lambda d: "prod")
+
+    def fake_download(url, dest, ua):
+        dest.write_bytes(b"img")
+
+    monkeypatch.setattr(dh, "download_binary", fake_download)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        res = si.download_images(
+            "http://example.com",
+            css_selector="img",
+            parent_dir=tmp_path,
+            use_alt_json=False,
+            max_threads=1,
+            executor=pool,
+        )
+        # The caller's pool must still accept work afterwards.
+        assert pool.submit(lambda: 1).result() == 1
+
+    assert len(list(res["folder"].iterdir())) == 3
+
+
 def test_load_alt_sentences_cache(tmp_path, monkeypatch):
     path = tmp_path / "sentences.json"
     path.write_text("{}", encoding="utf-8")
@@ -143,6 +179,7 @@ def test_load_alt_sentences_cache(tmp_path, monkeypatch):
         return {}
 
     monkeypatch.setattr(ru.json, "load", fake_load)
+    monkeypatch.setattr(ru, "orjson", None)
     ru._ALT_SENTENCES_CACHE.clear()
 
     ru.load_alt_sentences(path)
@@ -151,6 +188,29 @@ def test_load_alt_sentences_cache(tmp_path, monkeypatch):
     assert calls == [1]
 
 
+def test_load_alt_sentences_reloads_changed_file(tmp_path, monkeypatch):
+    path = tmp_path / "sentences.json"
+    path.write_text('{"A": ["x"]}', encoding="utf-8")
+    monkeypatch.setattr(ru, "orjson", None)
+    ru._ALT_SENTENCES_CACHE.clear()
+
+    assert ru.load_alt_sentences(path) == {"A": ["x"]}
+    path.write_text('{"B": ["yy"]}', encoding="utf-8")
+    assert ru.load_alt_sentences(path) == {"B": ["yy"]}
+    ru._ALT_SENTENCES_CACHE.clear()
+
+
+def test_load_alt_sentences_orjson(tmp_path, monkeypatch):
+    path = tmp_path / "sentences.json"
+    path.write_bytes(b'{"P": ["a"]}')
+    fake = types.SimpleNamespace(loads=lambda data: {"raw": data})
+    monkeypatch.setattr(ru, "orjson", fake)
+    ru._ALT_SENTENCES_CACHE.clear()
+
+    assert ru.load_alt_sentences(path) == {"raw": b'{"P": ["a"]}'}
+    ru._ALT_SENTENCES_CACHE.clear()
+
+
 def test_download_images_no_alt_when_empty_path(tmp_path, monkeypatch):
     elem = ElementDataSrc()
 
@@ -159,12 +219,11 @@ def test_download_images_no_alt_when_empty_path(tmp_path, monkeypatch):
     monkeypatch.setattr(si, "WebDriverWait", DummyWait)
     monkeypatch.setattr(si, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: driver)
-    monkeypatch.setattr(si, "setup_driver", lambda: driver)
     monkeypatch.setattr(si, "_find_product_name", lambda d: "prod")
     monkeypatch.setattr(dh, "download_binary", lambda url, dest, ua: dest.write_bytes(b"img"))
 
     load_calls = []
-    monkeypatch.setattr(ru, "load_alt_sentences", lambda p: load_calls.append(p) or {})
+    monkeypatch.setattr(ru, "load_alt_sentences", lambda p, **k: load_calls.append(p) or {})
     rename_calls = []
     monkeypatch.setattr(ru, "rename_with_alt", lambda *a, **k: rename_calls.append(a) or a[0])
 
@@ -189,7 +248,6 @@ def test_download_images_same_names_on_repeat(tmp_path, monkeypatch):
     monkeypatch.setattr(si, "WebDriverWait", DummyWait)
     monkeypatch.setattr(si, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: DummyDriver([elem]))
-    monkeypatch.setattr(si, "setup_driver", lambda: DummyDriver([elem]))
     monkeypatch.setattr(si, "_find_product_name", lambda d: "prod")
     monkeypatch.setattr(dh, "download_binary", lambda url, dest, ua: dest.write_bytes(b"img"))
 
@@ -221,7 +279,6 @@ def test_download_images_consistent_parallel_runs(tmp_path, monkeypatch):
     monkeypatch.setattr(si, "WebDriverWait", DummyWait)
     monkeypatch.setattr(si, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: DummyDriver([elem]))
-    monkeypatch.setattr(si, "setup_driver", lambda: DummyDriver([elem]))
     monkeypatch.setattr(si, "_find_product_name", lambda d: "prod")
     monkeypatch.setattr(dh, "download_binary", lambda url, dest, ua: dest.write_bytes(b"img"))
 
@@ -242,3 +299,214 @@ def test_download_images_consistent_parallel_runs(tmp_path, monkeypatch):
 
     assert len(results) == 2
     assert results[0] == results[1]
+
+
+def test_get_session_is_shared(monkeypatch):
+    created = []
+
+    class DummySession:
+        def __init__(self):
+            created.append(self)
+            self.headers = {}
+            self.mounted = {}
+
+        def mount(self, prefix, adapter):
+            self.mounted[prefix] = adapter
+
+    adapters = types.ModuleType("requests.adapters")
+    adapters.HTTPAdapter = lambda **kw: kw
+    retry_mod = types.ModuleType("urllib3.util.retry")
+    retry_mod.Retry = lambda **kw: kw
+    monkeypatch.setitem(sys.modules, "requests.adapters", adapters)
+    monkeypatch.setitem(sys.modules, "urllib3.util.retry", retry_mod)
+    monkeypatch.setattr(dh.requests, "Session", DummySession, raising=False)
+    monkeypatch.setattr(dh, "_SESSION", None)
+    monkeypatch.setattr(dh, "_SESSION_PID", None)
+
+    first = dh.get_session()
+    second = dh.get_session()
+
+    assert first is second
+    assert len(created) == 1
+    assert first.mounted["https://"]["pool_maxsize"] == 32
+    assert first.mounted["http://"] is first.mounted["https://"]
+
+    monkeypatch.setattr(dh.os, "getpid", lambda: -1)
+    assert dh.get_session() is not first
+    assert len(created) == 2
+
+
+def test_download_binary_streams_raw(tmp_path, monkeypatch):
+    import io
+
+    payload = b"x" * (dh._CHUNK_SIZE + 10)
+
+    class Resp:
+        def __init__(self):
+            self.raw = io.BytesIO(payload)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+    class Session:
+        def get(self, url, **kwargs):
+            assert kwargs["stream"] is True
+            return Resp()
+
+    monkeypatch.setattr(dh, "get_session", lambda: Session())
+    dest = tmp_path / "img.jpg"
+    dh.download_binary("http://example.com/img.jpg", dest)
+
+    assert dest.read_bytes() == payload
+
+
+def test_download_binary_removes_partial_file(tmp_path, monkeypatch):
+    import pytest
+
+    class ProtocolError(Exception):
+        pass
+
+    class Raw:
+        def __init__(self):
+            self.reads = 0
+
+        def read(self, size=-1):
+            self.reads += 1
+            if self.reads > 1:
+                raise ProtocolError("connection broken")
+            return b"partial"
+
+    class Resp:
+        raw = Raw()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+    class Session:
+        def get(self, url, **kwargs):
+            return Resp()
+
+    monkeypatch.setattr(dh, "get_session", lambda: Session())
+    dest = tmp_path / "img.jpg"
+    with pytest.raises(RuntimeError):
+        dh.download_binary("http://example.com/broken.jpg", dest)
+
+    assert not dest.exists()
+    assert "http://example.com/broken.jpg" not in dh._DOWNLOADED
+
+
+def test_fetch_static(monkeypatch):
+    import pytest
+
+    pytest.importorskip("bs4")
+
+    class Resp:
+        content = b"<html><body><span class='price'> 12 \xe2\x82\xac </span></body></html>"
+
+        def raise_for_status(self):
+            pass
+
+    class Session:
+        def get(self, url, **kwargs):
+            return Resp()
+
+    monkeypatch.setattr(dh, "get_session", lambda: Session())
+    elem = dh.fetch_static("http://example.com", "span.price")
+    assert elem.get_text().strip() == "12 €"
+    assert dh.fetch_static("http://example.com", "div.missing") is None
+
+
+def test_clean_filename():
+    assert ru.clean_filename("  Bébé  Chaussure (Rouge)!\t2-pack ") == "_bebe_chaussure_rouge_2-pack_"
+
+
+def test_unique_path_resumes_suffix(tmp_path, monkeypatch):
+    (tmp_path / "a.jpg").write_text("x")
+    reserved = dh.PathReservations()
+    probes = []
+    real_exists = Path.exists
+
+    def counting_exists(self):
+        probes.append(self)
+        return real_exists(self)
+
+    monkeypatch.setattr(Path, "exists", counting_exists)
+    names = [dh.unique_path(tmp_path, "a.jpg", reserved).name for _ in range(5)]
+
+    assert names == ["a_1.jpg", "a_2.jpg", "a_3.jpg", "a_4.jpg", "a_5.jpg"]
+    assert len(probes) == 6
+
+
+def test_download_images_copies_repeated_url(tmp_path, monkeypatch):
+    import io
+    from collections import OrderedDict
+
+    driver = DummyDriver([ElementDataSrc(), ElementDataSrc()])
+    monkeypatch.setattr(si, "WebDriverWait", DummyWait)
+    monkeypatch.setattr(si, "EC", DummyEC)
+    monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: driver)
+    monkeypatch.setattr(si, "_find_product_name", lambda d: "prod")
+    monkeypatch.setattr(dh, "_DOWNLOADED", OrderedDict())
+
+    gets = []
+
+    class Resp:
+        def __init__(self):
+            self.raw = io.BytesIO(b"img")
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+    class Session:
+        def get(self, url, **kwargs):
+            gets.append(url)
+            return Resp()
+
+    monkeypatch.setattr(dh, "get_session", lambda: Session())
+
+    res = si.download_images(
+        "http://example.com",
+        css_selector="img",
+        parent_dir=tmp_path,
+        use_alt_json=False,
+        max_threads=2,
+    )
+
+    assert gets == ["https://example.com/img/ds.png"]
+    files = sorted(res["folder"].iterdir())
+    assert [f.read_bytes() for f in files] == [b"img", b"img"]
+
+
+def test_find_product_name_single_script():
+    class Driver:
+        def __init__(self, result):
+            self.result = result
+            self.calls = 0
+
+        def execute_script(self, script):
+            self.calls += 1
+            return self.result
+
+    driver = Driver("  Chaise  ")
+    assert si._find_product_name(driver) == "Chaise"
+    assert driver.calls == 1
+    assert si._find_product_name(Driver("")) == "produit_woo"
+    assert si._find_product_name(Driver(None)) == "produit_woo"
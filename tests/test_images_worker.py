@@ -79,3 +79,162 @@ def test_worker_parallel(monkeypatch, tmp_path):
     assert progress[-1] == (4, 4)
     assert len(progress) == 5
 
+
+
+def test_worker_progress_coalesced(monkeypatch, tmp_path):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+
+    def fake_download(url, **kwargs):
+        cb = kwargs["progress_callback"]
+        for i in range(1, 1001):
+            cb(i, 1000)
+        return {"folder": tmp_path, "first_image": None}
+
+    monkeypatch.setattr(gw.scraper_images, "download_images", fake_download)
+    worker = gw.ScraperImagesWorker(
+        ["http://a"], tmp_path, "img", False, False, None, max_threads=1
+    )
+    progress = []
+    worker.progress.connect(lambda d, t: progress.append((d, t)))
+    worker.run()
+
+    assert progress[0] == (0, 0)
+    assert progress[-1] == (1000, 1000)
+    assert len(progress) <= 202
+
+
+def test_worker_dedups_urls(monkeypatch, tmp_path):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+
+    worker = gw.ScraperImagesWorker(
+        ["http://b", "http://a", "http://b"], tmp_path, "img", False, False, None
+    )
+
+    assert worker.urls == ["http://b", "http://a"]
+
+
+def test_worker_preview_from_first_saved_image(monkeypatch, tmp_path):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+
+    def fake_download(url, **kwargs):
+        kwargs["first_image_callback"](tmp_path / f"{url[-1]}.jpg")
+        return {"folder": tmp_path, "first_image": None}
+
+    monkeypatch.setattr(gw.scraper_images, "download_images", fake_download)
+    worker = gw.ScraperImagesWorker(
+        ["http://a", "http://b"], tmp_path, "img", False, True, None, max_jobs=2
+    )
+    previews = []
+    worker.preview_path.connect(previews.append)
+    worker.run()
+
+    assert len(previews) == 1
+    assert previews[0] in {str(tmp_path / "a.jpg"), str(tmp_path / "b.jpg")}
+
+
+def test_worker_opens_each_folder_once(monkeypatch, tmp_path):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+    opened = []
+
+    monkeypatch.setattr(
+        gw.scraper_images,
+        "download_images",
+        lambda url, **kw: {"folder": tmp_path / "same", "first_image": None},
+    )
+    monkeypatch.setattr(gw.scraper_images, "_open_folder", lambda p, **k: opened.append(p))
+    worker = gw.ScraperImagesWorker(
+        ["http://a", "http://b"], tmp_path, "img", True, False, None
+    )
+    worker.run()
+
+    assert opened == [tmp_path / "same"]
+
+
+def test_worker_logs_rename_warnings(monkeypatch, tmp_path):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+    si = gw.scraper_images
+
+    class Driver:
+        def get(self, url):
+            pass
+
+        def execute_script(self, script, selector):
+            return [["https://example.com/a.png", None, None]]
+
+        def quit(self):
+            pass
+
+    class Wait:
+        def __init__(self, driver, timeout):
+            pass
+
+        def until(self, condition):
+            return True
+
+    monkeypatch.setattr(si, "WebDriverWait", Wait)
+    monkeypatch.setattr(
+        si, "EC", types.SimpleNamespace(presence_of_element_located=lambda loc: None)
+    )
+    monkeypatch.setattr("interface_py.driver_utils.setup_driver", Driver)
+    monkeypatch.setattr(si, "_find_product_name", lambda d: "prod")
+    monkeypatch.setattr(
+        si.dl_helpers, "download_binary", lambda url, dest, ua: dest.write_bytes(b"img")
+    )
+    alt = tmp_path / "alt.json"
+    alt.write_text("{}", encoding="utf-8")
+
+    worker = gw.ScraperImagesWorker(
+        ["http://a"], tmp_path, "img", False, False, str(alt)
+    )
+    lines = []
+    worker.log.connect(lines.append)
+    worker.run()
+
+    assert any("absente de product_sentences.json" in line for line in lines)
+
+
+def test_download_pool_covers_thread_spinbox(monkeypatch):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+    from interface_py.constants import MAX_DOWNLOAD_THREADS
+
+    assert gw._DOWNLOAD_POOL._max_workers >= MAX_DOWNLOAD_THREADS
+
+
+def test_worker_clamps_max_jobs(monkeypatch, tmp_path):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+    worker = gw.ScraperImagesWorker(
+        ["http://a"], tmp_path, "img", False, False, None, max_jobs=1000
+    )
+
+    assert worker.max_jobs == gw._JOB_POOL._max_workers
+
+
+def test_delete_folders_worker(monkeypatch, tmp_path):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+
+    (tmp_path / "prod_a" / "sub").mkdir(parents=True)
+    (tmp_path / "prod_a" / "sub" / "img.jpg").write_bytes(b"x")
+    (tmp_path / "prod_b").mkdir()
+    (tmp_path / "keep.txt").write_text("ok")
+
+    worker = gw.DeleteFoldersWorker(tmp_path)
+    errors = []
+    worker.failed.connect(errors.append)
+    worker.run()
+
+    assert errors == []
+    assert [p.name for p in tmp_path.iterdir()] == ["keep.txt"]
+
+    missing = gw.DeleteFoldersWorker(tmp_path / "absent")
+    missing_errors = []
+    missing.failed.connect(missing_errors.append)
+    missing.run()
+    assert len(missing_errors) == 1
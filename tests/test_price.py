@@ -37,12 +37,39 @@ def test_extract_price(monkeypatch):
     monkeypatch.setattr(sp, "WebDriverWait", DummyWait)
     monkeypatch.setattr(sp, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: DummyDriver())
-    monkeypatch.setattr(sp, "setup_driver", lambda: DummyDriver())
+    monkeypatch.setattr(sp, "fetch_static", lambda url, selector, **k: None)
 
     price = sp.extract_price("https://example.com", "span")
     assert price == "42 \u20ac"
 
 
+def test_extract_price_static(monkeypatch):
+    class StaticElement:
+        def get_text(self):
+            return "\n 19 \u20ac \n"
+
+    def no_driver():
+        raise AssertionError("browser should not start")
+
+    monkeypatch.setattr(sp, "fetch_static", lambda url, selector, **k: StaticElement())
+    monkeypatch.setattr("interface_py.driver_utils.setup_driver", no_driver)
+
+    assert sp.extract_price("https://example.com", "span", static=True) == "19 \u20ac"
+
+
+def test_extract_price_prefers_rendered_value_by_default(monkeypatch):
+    class StaticElement:
+        def get_text(self):
+            return "99 \u20ac"
+
+    monkeypatch.setattr(sp, "WebDriverWait", DummyWait)
+    monkeypatch.setattr(sp, "EC", DummyEC)
+    monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: DummyDriver())
+    monkeypatch.setattr(sp, "fetch_static", lambda url, selector, **k: StaticElement())
+
+    assert sp.extract_price("https://example.com", "span") == "42 \u20ac"
+
+
 def test_save_price_to_file(tmp_path):
     dest = tmp_path / "price.txt"
     sp.save_price_to_file("10", dest)
@@ -24,6 +24,12 @@ class DummyDriver:
     def find_elements(self, by, selector):
         return [DummyElement("A", "/a"), DummyElement("B", "http://b")] 
 
+    def execute_script(self, script, selector):
+        return [
+            [el.get_attribute("innerText"), el.get_attribute("href")]
+            for el in self.find_elements(None, selector)
+        ]
+
     def find_element(self, by, selector):
         raise Exception("no next")
 
@@ -50,7 +56,7 @@ class DummyEC:
 
 
 def setup_dummy(monkeypatch):
-    monkeypatch.setattr(slc, "setup_driver", lambda: DummyDriver())
+    monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: DummyDriver())
     monkeypatch.setattr(slc, "WebDriverWait", DummyWait)
     monkeypatch.setattr(slc, "EC", DummyEC)
 
@@ -80,3 +86,30 @@ def test_output_txt(tmp_path, monkeypatch):
     content = dest.read_text(encoding="utf-8-sig").splitlines()
     assert content[0].startswith("A - http://example.com/a")
 
+
+
+def test_output_json_streamed_layout(tmp_path, monkeypatch):
+    setup_dummy(monkeypatch)
+    dest = tmp_path / "out.json"
+    slc.scrape_collection("http://example.com", dest, output_format="json")
+    expected = [
+        {"name": "A", "url": "http://example.com/a"},
+        {"name": "B", "url": "http://b"},
+    ]
+    assert dest.read_text(encoding="utf-8") == json.dumps(expected, ensure_ascii=False, indent=2)
+
+
+def test_driver_failure_keeps_previous_output(tmp_path, monkeypatch):
+    import pytest
+
+    def broken_driver():
+        raise RuntimeError("chrome failed")
+
+    monkeypatch.setattr(slc, "acquire_driver", broken_driver)
+    dest = tmp_path / "out.json"
+    dest.write_text('[{"name": "old"}]', encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        slc.scrape_collection("http://example.com", dest, output_format="json")
+
+    assert dest.read_text(encoding="utf-8") == '[{"name": "old"}]'
@@ -52,11 +52,11 @@ def test_scrap_variant_worker_run(monkeypatch, tmp_path):
     gw = __import__("gui.workers", fromlist=["dummy"])
     calls = []
 
-    def fake_extract(url):
+    def fake_extract(url, logger=None):
         calls.append(("extract", url))
         return "title", {"v": "img"}
 
-    def fake_save(title, mapping, path):
+    def fake_save(title, mapping, path, logger=None):
         calls.append(("save", title, mapping, path))
 
     monkeypatch.setattr(gw.moteur_variante, "extract_variants_with_images", fake_extract)
@@ -69,3 +69,25 @@ def test_scrap_variant_worker_run(monkeypatch, tmp_path):
         ("extract", "http://ex"),
         ("save", "title", {"v": "img"}, tmp_path / "o.txt"),
     ]
+
+
+def test_worker_logger_is_private(monkeypatch, tmp_path):
+    setup_pyside(monkeypatch)
+    gw = __import__("gui.workers", fromlist=["dummy"])
+    import logging
+
+    def fake_extract(url, use_cache=True, logger=None):
+        logger.info("chargement %s", url)
+        return "title", {}
+
+    monkeypatch.setattr(gw.moteur_variante, "extract_variants_with_images", fake_extract)
+
+    root_handlers = list(logging.getLogger().handlers)
+    worker = gw.VariantFetchWorker("http://ex")
+    messages = []
+    worker.log.connect(messages.append)
+    worker.run()
+
+    assert messages == ["INFO: chargement http://ex"]
+    assert worker.logger.propagate is False
+    assert logging.getLogger().handlers == root_handlers
@@ -35,7 +35,6 @@ def test_extract_variants(monkeypatch):
     monkeypatch.setattr(mv, "WebDriverWait", DummyWait)
     monkeypatch.setattr(mv, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: DummyDriver())
-    monkeypatch.setattr(mv, "setup_driver", lambda: DummyDriver())
 
     title, variants = mv.extract_variants("https://example.com")
     assert title == "Title"
@@ -101,9 +100,17 @@ class DummyDriverImages:
         if value == ".product-gallery__media.is-selected img":
             return self.image
 
-    def execute_script(self, script, elem):
-        self.image.src = elem._src
-        elem.click()
+    def set_script_timeout(self, timeout):
+        self.script_timeout = timeout
+
+    def execute_async_script(self, script, timeout):
+        results = []
+        for inp in self.inputs:
+            if not inp._selected:
+                self.image.src = inp._src
+                inp.click()
+            results.append([inp._value, self.image.src])
+        return results
 
     def quit(self):
         self.closed = True
@@ -122,8 +129,7 @@ def test_extract_variants_with_images(monkeypatch):
     monkeypatch.setattr(mv, "WebDriverWait", DummyWait2)
     monkeypatch.setattr(mv, "EC", DummyEC)
     monkeypatch.setattr("interface_py.driver_utils.setup_driver", lambda: driver)
-    monkeypatch.setattr(mv, "setup_driver", lambda: driver)
-    monkeypatch.setattr(mv.time, "sleep", lambda x: None)
+    monkeypatch.setattr(mv, "_VARIANT_CACHE", type(mv._VARIANT_CACHE)())
 
     title, mapping = mv.extract_variants_with_images("https://example.com")
     assert title == "Title"
@@ -137,3 +143,25 @@ def test_extract_variants_with_images(monkeypatch):
         "Blue : blue.png",
     ]
     tmp.unlink()
+
+
+def test_extract_variants_with_images_cached(monkeypatch):
+    calls = []
+
+    def fake_setup():
+        calls.append(1)
+        return DummyDriverImages()
+
+    monkeypatch.setattr(mv, "WebDriverWait", DummyWait2)
+    monkeypatch.setattr(mv, "EC", DummyEC)
+    monkeypatch.setattr("interface_py.driver_utils.setup_driver", fake_setup)
+    monkeypatch.setattr(mv, "_VARIANT_CACHE", type(mv._VARIANT_CACHE)())
+
+    first = mv.extract_variants_with_images("https://example.com")
+    first[1]["Green"] = "green.png"
+    second = mv.extract_variants_with_images("https://example.com")
+    assert calls == [1]
+    assert second == ("Title", {"Red": "red.png", "Blue": "blue.png"})
+
+    mv.extract_variants_with_images("https://example.com", use_cache=False)
+    assert calls == [1, 1]